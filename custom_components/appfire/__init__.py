@@ -1,14 +1,33 @@
 """The AppFire integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+
+# Import time of the integration, reported in diagnostics. Taken before the
+# imports below on purpose, they are what is being measured.
+_IMPORT_STARTED = time.monotonic()
+
+# pylint: disable=wrong-import-position
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import (
+    config_validation as cv,
+    discovery,
+    entity_registry as er,
+)
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
 
-from .lib.appfire_client.appfire import AppFire
+from .aggregator import AppFireFleetAggregator
 from .coordinator import AppFireCoordinator
+from .estimator import PelletEstimator, parse_calibration_curve
+from . import websocket_api
+from .services import async_setup_services
 
 from .const import (
     DOMAIN,
@@ -17,43 +36,212 @@ from .const import (
     CONF_STOVE_NAME,
     CONF_SERIAL,
     CONF_POLLING_INTERVAL,
+    CONF_PROXY_PORT,
+    CONF_RATE_LIMIT,
+    CONF_RATE_BURST,
+    CONF_CALIBRATION_CURVE,
+    DEFAULT_CALIBRATION_CURVE,
+    DEFAULT_PROXY_PORT,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_RATE_BURST,
     DEFAULT_SCAN_INTERVAL_S,
+    PROXY_CACHE_TTL_S,
+    DATA_AGGREGATOR,
+    DATA_CONNECTION_LIMITER,
+    DATA_STOVE_ADDRESSES,
+    DATA_STOVE_ADDRESSES_STORE,
+    MAX_PARALLEL_CONNECTIONS,
+    STORAGE_VERSION,
 )
 
-PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.NUMBER, Platform.SWITCH]
+# pylint: enable=wrong-import-position
+
+PLATFORMS: list[Platform] = [
+    Platform.BINARY_SENSOR,
+    Platform.CALENDAR,
+    Platform.CLIMATE,
+    Platform.SENSOR,
+    Platform.NUMBER,
+    Platform.SWITCH,
+]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 _LOGGER = logging.getLogger(__name__)
 
+IMPORT_TIME_S = round(time.monotonic() - _IMPORT_STARTED, 3)
+
+
+def _import_client():
+    """Import the protocol client, only needed once a stove is set up."""
+    # Pulls in every message class, kept out of the integration import
+    # pylint: disable=import-outside-toplevel
+    from .lib.appfire_client.appfire import AppFire
+    from .lib.appfire_client.proxy import AppFireProxy
+    from .lib.appfire_client.rate_limiter import TokenBucket
+
+    return AppFire, AppFireProxy, TokenBucket
+
+
+def _get_platforms_to_set_up(hass: HomeAssistant, entry: ConfigEntry) -> list[Platform]:
+    """Return the platforms that have an enabled entity, or no entity yet."""
+    enabled: dict[str, bool] = {}
+    for entity_entry in er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id):
+        enabled[entity_entry.domain] = (
+            enabled.get(entity_entry.domain, False) or not entity_entry.disabled
+        )
+    # Enabling an entity reloads the entry, which sets its platform up
+    return [platform for platform in PLATFORMS if enabled.get(platform, True)]
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the AppFire integration."""
+    websocket_api.async_setup(hass)
+    async_setup_services(hass)
+
+    # Addresses the stoves were seen at, to find them again when they move
+    store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.stove_addresses")
+    hass.data[DATA_STOVE_ADDRESSES] = await store.async_load() or {}
+    hass.data[DATA_STOVE_ADDRESSES_STORE] = store
+
+    # Site-wide sensors, fed by the coordinators as entries are set up
+    hass.data[DATA_AGGREGATOR] = AppFireFleetAggregator()
+    hass.async_create_task(
+        discovery.async_load_platform(hass, Platform.SENSOR, DOMAIN, {}, config)
+    )
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up AppFire from a config entry."""
     _LOGGER.debug("Setting up AppFire entry: %s", entry.entry_id)
+    setup_started = time.monotonic()
+
+    # The client is imported by the first entry only, outside the event loop
+    AppFire, AppFireProxy, TokenBucket = await hass.async_add_executor_job(_import_client)
+    client_imported = time.monotonic()
 
     # 1. Create API instance
-    api = AppFire(entry.data.get(CONF_IP), entry.data.get(CONF_PORT))
+    #    The rate limiter protects the stove from request storms. With the
+    #    proxy enabled, the stove link is shared with other local clients
+    #    (e.g. the vendor app) and the integration goes through it too, so
+    #    the limit is applied by the proxy
+    rate_limiter = TokenBucket(
+        entry.data.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT) / 60,
+        entry.data.get(CONF_RATE_BURST, DEFAULT_RATE_BURST),
+    )
+    proxy = None
+    proxy_port = entry.data.get(CONF_PROXY_PORT, DEFAULT_PROXY_PORT)
+    if proxy_port:
+        proxy = AppFireProxy(
+            entry.data.get(CONF_IP),
+            entry.data.get(CONF_PORT),
+            port=proxy_port,
+            cacheTtl=PROXY_CACHE_TTL_S,
+            rateLimiter=rate_limiter,
+        )
+        try:
+            await proxy.start()
+        except OSError as err:
+            raise ConfigEntryNotReady(f"Cannot start proxy on port {proxy_port}: {err}") from err
+        # The proxy retries upstream itself, a resend would queue the same
+        # request again behind the first one. Its rate limit waits happen
+        # after the request is sent, so the reply timeout has to cover them
+        api = AppFire(
+            "127.0.0.1",
+            proxy_port,
+            maxAttempts=1,
+            timeout=proxy.getClientTimeout(),
+        )
+    else:
+        api = AppFire(entry.data.get(CONF_IP), entry.data.get(CONF_PORT), rate_limiter)
     stove_name = entry.data.get(CONF_STOVE_NAME)
     stove_serial = entry.data.get(CONF_SERIAL)
     polling_interval = entry.data.get(CONF_POLLING_INTERVAL, DEFAULT_SCAN_INTERVAL_S)
 
     # 2. Create data coordinator
     coordinator = AppFireCoordinator(hass, stove_name, stove_serial, api, polling_interval)
+    coordinator.proxy = proxy
+    coordinator.rate_limiter = rate_limiter
+
+    # Pellet consumption estimate, its totals survive restarts
+    coordinator.estimator = PelletEstimator(
+        parse_calibration_curve(
+            entry.data.get(CONF_CALIBRATION_CURVE, DEFAULT_CALIBRATION_CURVE)
+        )
+    )
+    coordinator.estimator_store = _get_estimator_store(hass, entry)
+    if (stored := await coordinator.estimator_store.async_load()) is not None:
+        coordinator.estimator.restore(stored)
 
     # 3. Fetch initial data so we have data when entities subscribe
     #    If the refresh fails, async_config_entry_first_refresh will
     #    raise ConfigEntryNotReady and setup will try again later
-    await coordinator.async_config_entry_first_refresh()
+    #    Entries are set up concurrently, the shared limiter only bounds
+    #    how many stoves are contacted at the same time
+    limiter = hass.data.setdefault(
+        DATA_CONNECTION_LIMITER, asyncio.Semaphore(MAX_PARALLEL_CONNECTIONS)
+    )
+    async with limiter:
+        refresh_started = time.monotonic()
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception:
+            if proxy is not None:
+                await proxy.stop()
+            raise
+    refresh_done = time.monotonic()
 
     # 4. Store the coordinator for your platforms to access
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
-
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    hass.data[DATA_AGGREGATOR].async_add_coordinator(entry.entry_id, coordinator)
+
+    coordinator.platforms = _get_platforms_to_set_up(hass, entry)
+    await hass.config_entries.async_forward_entry_setups(entry, coordinator.platforms)
+    setup_done = time.monotonic()
+
+    coordinator.startup_timings = {
+        "integration_import_s": IMPORT_TIME_S,
+        "client_import_s": round(client_imported - setup_started, 3),
+        "limiter_wait_s": round(refresh_started - client_imported, 3),
+        "first_refresh_s": round(refresh_done - refresh_started, 3),
+        "platforms_setup_s": round(setup_done - refresh_done, 3),
+        "total_s": round(setup_done - setup_started, 3),
+        "platforms_skipped": sorted(set(PLATFORMS) - set(coordinator.platforms)),
+    }
+    _LOGGER.debug("AppFire entry %s set up in %.3fs", entry.entry_id, setup_done - setup_started)
 
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+    platforms = hass.data[DOMAIN][entry.entry_id].platforms
+    if unload_ok := await hass.config_entries.async_unload_platforms(entry, platforms):
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        hass.data[DATA_AGGREGATOR].async_remove_coordinator(entry.entry_id)
+        coordinator.async_stop_telemetry()
+        coordinator.async_stop_rediscovery()
+        await coordinator.estimator_store.async_save(coordinator.estimator.as_dict())
+        if coordinator.proxy is not None:
+            await coordinator.proxy.stop()
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the data saved for a config entry."""
+    await _get_estimator_store(hass, entry).async_remove()
+
+    addresses: dict[str, str] = hass.data.get(DATA_STOVE_ADDRESSES, {})
+    serial = entry.data.get(CONF_SERIAL)
+    for ip in [ip for ip, owner in addresses.items() if owner == serial]:
+        del addresses[ip]
+    if (store := hass.data.get(DATA_STOVE_ADDRESSES_STORE)) is not None:
+        await store.async_save(addresses)
+
+
+def _get_estimator_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    """Return the store of the consumption totals of a stove."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.consumption")
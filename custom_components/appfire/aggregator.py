@@ -0,0 +1,145 @@
+"""Site-wide aggregates over all the AppFire stoves."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import NamedTuple
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+from .const import (
+    API_DATA_LOOKUP_AMBIENT_TEMPERATURE,
+    API_DATA_LOOKUP_POWER_PERCENTAGE,
+    API_DATA_LOOKUP_STOVE_STATUS,
+)
+from .coordinator import AppFireCoordinator
+from .estimator import BURNING_STATUSES
+from .lib.appfire_client.status.stove_status import StoveStatus
+
+ERROR_STATUSES = {
+    StoveStatus.ERROR_END_PELLET,
+    StoveStatus.ERROR_SCREW_JAMMED,
+}
+
+
+class _Contribution(NamedTuple):
+    """What one stove adds to the aggregates."""
+
+    stoves: int = 0
+    burning: int = 0
+    power_percentage: float = 0
+    ambient_temperature_sum: float = 0.0
+    ambient_temperature_count: int = 0
+    in_error: int = 0
+
+
+_NONE = _Contribution()
+
+
+def _contribution_of(coordinator: AppFireCoordinator) -> _Contribution:
+    """Return what a stove adds to the aggregates, nothing if it is unreachable."""
+    data = coordinator.data
+    if not coordinator.last_update_success or data is None:
+        return _NONE
+
+    status = data.get(API_DATA_LOOKUP_STOVE_STATUS)
+    ambient_temperature = data.get(API_DATA_LOOKUP_AMBIENT_TEMPERATURE)
+    return _Contribution(
+        stoves=1,
+        burning=int(status in BURNING_STATUSES),
+        power_percentage=data.get(API_DATA_LOOKUP_POWER_PERCENTAGE) or 0,
+        ambient_temperature_sum=ambient_temperature or 0.0,
+        ambient_temperature_count=int(ambient_temperature is not None),
+        in_error=int(status in ERROR_STATUSES),
+    )
+
+
+class AppFireFleetAggregator:
+    """Keep aggregates over the stoves up to date.
+
+    Each coordinator update replaces the contribution of its stove: the
+    old one is subtracted from the totals and the new one added, whatever
+    the number of stoves.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the aggregator."""
+        self._contributions: dict[str, _Contribution] = {}
+        self._totals = _NONE
+        self._unsubscribe: dict[str, CALLBACK_TYPE] = {}
+        self._listeners: list[Callable[[], None]] = []
+
+    @property
+    def stoves(self) -> int:
+        """Return the number of stoves answering."""
+        return self._totals.stoves
+
+    @property
+    def stoves_burning(self) -> int:
+        """Return the number of stoves burning."""
+        return self._totals.burning
+
+    @property
+    def stoves_in_error(self) -> int:
+        """Return the number of stoves reporting an error."""
+        return self._totals.in_error
+
+    @property
+    def total_power_percentage(self) -> float:
+        """Return the sum of the power levels of the stoves."""
+        return self._totals.power_percentage
+
+    @property
+    def mean_ambient_temperature(self) -> float | None:
+        """Return the mean ambient temperature of the stoves."""
+        if not self._totals.ambient_temperature_count:
+            return None
+        return round(
+            self._totals.ambient_temperature_sum / self._totals.ambient_temperature_count, 1
+        )
+
+    @callback
+    def async_add_coordinator(self, entry_id: str, coordinator: AppFireCoordinator) -> None:
+        """Follow the updates of a stove."""
+
+        @callback
+        def handle_update() -> None:
+            self._async_set_contribution(entry_id, _contribution_of(coordinator))
+
+        self._unsubscribe[entry_id] = coordinator.async_add_listener(handle_update)
+        handle_update()
+
+    @callback
+    def async_remove_coordinator(self, entry_id: str) -> None:
+        """Stop following a stove and drop it from the aggregates."""
+        if (unsubscribe := self._unsubscribe.pop(entry_id, None)) is not None:
+            unsubscribe()
+        self._async_set_contribution(entry_id, _NONE)
+
+    @callback
+    def async_add_listener(self, listener: Callable[[], None]) -> CALLBACK_TYPE:
+        """Call the listener when the aggregates change."""
+        self._listeners.append(listener)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(listener)
+
+        return remove_listener
+
+    @callback
+    def _async_set_contribution(self, entry_id: str, contribution: _Contribution) -> None:
+        """Replace the contribution of a stove in the totals."""
+        previous = self._contributions.pop(entry_id, _NONE)
+        if contribution != _NONE:
+            self._contributions[entry_id] = contribution
+        if contribution == previous:
+            return
+
+        self._totals = _Contribution(
+            *(
+                total - old + new
+                for total, old, new in zip(self._totals, previous, contribution)
+            )
+        )
+        for listener in list(self._listeners):
+            listener()
@@ -0,0 +1,122 @@
+"""Combustion anomaly detection for AppFire stoves."""
+from __future__ import annotations
+
+import math
+from typing import Any
+
+from .const import (
+    API_DATA_LOOKUP_SMOKE_FAN_RPM,
+    API_DATA_LOOKUP_SMOKE_TEMPERATURE,
+    API_DATA_LOOKUP_STOVE_STATUS,
+    ANOMALY_EWMA_ALPHA,
+    ANOMALY_Z_THRESHOLD,
+    ANOMALY_WARMUP_SAMPLES,
+    ANOMALY_CONSECUTIVE_SAMPLES,
+)
+from .lib.appfire_client.status.stove_status import StoveStatus
+
+# Values watched for drifts, e.g. a jammed auger or a dirty burner
+WATCHED_KEYS = (API_DATA_LOOKUP_SMOKE_TEMPERATURE, API_DATA_LOOKUP_SMOKE_FAN_RPM)
+
+
+class EwmaZScore:
+    """Exponentially weighted mean and variance of a value.
+
+    Memory and time are constant per sample, no history is kept.
+    """
+
+    def __init__(self, alpha: float) -> None:
+        """Initialize the statistics."""
+        self._alpha = alpha
+        self.samples = 0
+        self.mean = 0.0
+        self.variance = 0.0
+
+    def z_score(self, value: float) -> float:
+        """Return how many deviations the value is from the mean."""
+        if self.variance <= 0:
+            return 0.0
+        return (value - self.mean) / math.sqrt(self.variance)
+
+    def update(self, value: float) -> None:
+        """Add a sample."""
+        self.samples += 1
+        if self.samples == 1:
+            self.mean = value
+            return
+        delta = value - self.mean
+        self.mean += self._alpha * delta
+        self.variance = (1 - self._alpha) * (self.variance + self._alpha * delta * delta)
+
+
+class AnomalyDetector:
+    """Flag the watched values of a stove that drift from their recent trend.
+
+    Only samples taken while the stove burns steadily are considered, the
+    start up and shut down phases swing too much. A value is anomalous
+    after enough consecutive samples beyond the z-score threshold, a
+    single outlier is ignored, and stays so until a sample is back in
+    range.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the detector."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the trends."""
+        self._stats = {key: EwmaZScore(ANOMALY_EWMA_ALPHA) for key in WATCHED_KEYS}
+        self._outliers = {key: 0 for key in WATCHED_KEYS}
+        self.z_scores: dict[str, float] = {key: 0.0 for key in WATCHED_KEYS}
+        self.anomalies: set[str] = set()
+
+    @property
+    def is_anomalous(self) -> bool:
+        """Return True if a watched value is drifting."""
+        return bool(self.anomalies)
+
+    def update(self, data: dict[str, Any]) -> set[str]:
+        """Add a sample and return the values that just became anomalous."""
+        if data.get(API_DATA_LOOKUP_STOVE_STATUS) != StoveStatus.ON:
+            # The trend starts over at the next steady burn
+            if any(stats.samples for stats in self._stats.values()):
+                self.reset()
+            return set()
+
+        new_anomalies = set()
+        for key, stats in self._stats.items():
+            value = data.get(key)
+            if value is None:
+                continue
+
+            z_score = stats.z_score(value)
+            self.z_scores[key] = z_score
+            if stats.samples >= ANOMALY_WARMUP_SAMPLES and abs(z_score) > ANOMALY_Z_THRESHOLD:
+                self._outliers[key] += 1
+                if self._outliers[key] >= ANOMALY_CONSECUTIVE_SAMPLES and key not in self.anomalies:
+                    self.anomalies.add(key)
+                    new_anomalies.add(key)
+                # Outliers only move the baseline as far as the threshold,
+                # a lasting change is absorbed slowly instead of at once
+                limit = ANOMALY_Z_THRESHOLD * math.sqrt(stats.variance)
+                value = min(max(value, stats.mean - limit), stats.mean + limit)
+            else:
+                self._outliers[key] = 0
+                self.anomalies.discard(key)
+
+            stats.update(value)
+
+        return new_anomalies
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state of the detector."""
+        return {
+            key: {
+                "mean": round(stats.mean, 2),
+                "deviation": round(math.sqrt(stats.variance), 2),
+                "z_score": round(self.z_scores[key], 2),
+                "samples": stats.samples,
+                "anomalous": key in self.anomalies,
+            }
+            for key, stats in self._stats.items()
+        }
@@ -0,0 +1,85 @@
+"""Platform for binary sensor integration."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+from typing import Any
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+    BinarySensorEntityDescription,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .anomaly import WATCHED_KEYS
+from .const import DOMAIN, ESTIMATE_ANOMALY
+from .coordinator import AppFireCoordinator
+from .entity import AppFireEntity
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, kw_only=True)
+class AppFireBinarySensorEntityDescription(BinarySensorEntityDescription):
+    """Describes an AppFire binary sensor, the key is the coordinator data key."""
+
+    unique_id_suffix: str
+
+
+BINARY_SENSOR_DESCRIPTIONS: tuple[AppFireBinarySensorEntityDescription, ...] = (
+    AppFireBinarySensorEntityDescription(
+        key=ESTIMATE_ANOMALY,
+        unique_id_suffix="binary_sensor_combustion_anomaly",
+        translation_key="combustion_anomaly",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the binary sensor entity."""
+
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+
+    async_add_entities(
+        AppFireBinarySensor(coordinator, description)
+        for description in BINARY_SENSOR_DESCRIPTIONS
+    )
+
+
+class AppFireBinarySensor(AppFireEntity, BinarySensorEntity):
+    """Binary sensor for one value computed from the stove data."""
+
+    entity_description: AppFireBinarySensorEntityDescription
+    # The trends change at every update, they are not worth a recorder row
+    _unrecorded_attributes = frozenset(WATCHED_KEYS)
+
+    def __init__(
+        self,
+        coordinator: AppFireCoordinator,
+        description: AppFireBinarySensorEntityDescription,
+    ) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator, context=description.key)
+        self.entity_description = description
+        self._attr_unique_id = (
+            f"{self.coordinator.stove_serial}_{description.unique_id_suffix}"
+        )
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the trends the detection is based on."""
+        return self.coordinator.anomaly_detector.as_dict()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._attr_is_on = self.coordinator.data.get(self.entity_description.key)
+        self.async_write_ha_state()
@@ -0,0 +1,76 @@
+"""Platform for calendar integration."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, API_DATA_LOOKUP_CRONO_SCHEDULE
+from .coordinator import AppFireCoordinator
+from .crono import iter_slots
+from .entity import AppFireEntity
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the calendar entity."""
+
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+
+    async_add_entities([CronoSchedule(coordinator)])
+
+
+class CronoSchedule(AppFireEntity, CalendarEntity):
+    """Weekly on/off schedule of the stove, one event per slot.
+
+    Events come from the schedule cached by the coordinator, asking for
+    them never contacts the stove. The stove only follows the schedule
+    while its crono mode is on.
+    """
+
+    _attr_translation_key = "crono_schedule"
+    _attr_icon = "mdi:calendar-clock"
+    # The schedule layout is not confirmed on every stove model
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(self, coordinator: AppFireCoordinator) -> None:
+        """Initialize the calendar."""
+        super().__init__(coordinator, context=API_DATA_LOOKUP_CRONO_SCHEDULE)
+        self._attr_unique_id = f"{self.coordinator.stove_serial}_calendar_crono_schedule"
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the slot in progress or the next one."""
+        now = dt_util.now()
+        events = self._events(now, now + timedelta(days=8))
+        return events[0] if events else None
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        """Return the slots between the given dates."""
+        return self._events(start_date, end_date)
+
+    def _events(self, start: datetime, end: datetime) -> list[CalendarEvent]:
+        """Return the slots of the cached schedule overlapping [start, end)."""
+        schedule = self.coordinator.data.get(API_DATA_LOOKUP_CRONO_SCHEDULE)
+        if not schedule:
+            return []
+        return [
+            CalendarEvent(
+                start=slot_start,
+                end=slot_end,
+                summary=f"{self.coordinator.get_stove_name_or_serial()} on",
+            )
+            for slot_start, slot_end in iter_slots(schedule, start, end)
+        ]
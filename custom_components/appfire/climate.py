@@ -0,0 +1,145 @@
+"""Platform for climate integration."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.components.climate import (
+    ATTR_HVAC_MODE,
+    ClimateEntity,
+    ClimateEntityFeature,
+    HVACAction,
+    HVACMode,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import (
+    DOMAIN,
+    API_DATA_LOOKUP_AMBIENT_TEMPERATURE,
+    API_DATA_LOOKUP_DESIRED_AMBIENT_TEMPERATURE,
+    API_DATA_LOOKUP_POWER_STATUS,
+    API_DATA_LOOKUP_STOVE_STATUS,
+)
+from .coordinator import AppFireCoordinator
+from .entity import AppFireEntity
+from .lib.appfire_client.status.stove_status import StoveStatus
+
+_LOGGER = logging.getLogger(__name__)
+
+HVAC_ACTION_OF_STATUS = {
+    StoveStatus.OFF: HVACAction.OFF,
+    StoveStatus.CHECKING_BEFORE_START: HVACAction.PREHEATING,
+    StoveStatus.CLEANING_BEFORE_START: HVACAction.PREHEATING,
+    StoveStatus.PRELOAD: HVACAction.PREHEATING,
+    StoveStatus.WAITING_FIRE: HVACAction.PREHEATING,
+    StoveStatus.START_BURNING: HVACAction.PREHEATING,
+    StoveStatus.STABILIZATION: HVACAction.HEATING,
+    StoveStatus.ON: HVACAction.HEATING,
+    StoveStatus.WARNING_LOW_PELLET: HVACAction.HEATING,
+    StoveStatus.TURNING_OFF: HVACAction.IDLE,
+    StoveStatus.COOLING_DOWN: HVACAction.IDLE,
+    StoveStatus.CLEAN_BURNER: HVACAction.IDLE,
+    StoveStatus.ERROR_END_PELLET: HVACAction.OFF,
+    StoveStatus.ERROR_SCREW_JAMMED: HVACAction.OFF,
+}
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the climate entity."""
+
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+
+    async_add_entities([Thermostat(coordinator)])
+
+
+class Thermostat(AppFireEntity, ClimateEntity):
+    """Climate entity for the stove power and desired ambient temperature."""
+
+    # Named after the device, the stove itself
+    _attr_name = None
+    _attr_hvac_modes = [HVACMode.OFF, HVACMode.HEAT]
+    _attr_supported_features = (
+        ClimateEntityFeature.TARGET_TEMPERATURE
+        | ClimateEntityFeature.TURN_ON
+        | ClimateEntityFeature.TURN_OFF
+    )
+    _attr_temperature_unit = UnitOfTemperature.CELSIUS
+    _attr_target_temperature_step = 0.1
+    _enable_turn_on_off_backwards_compatibility = False
+
+    def __init__(self, coordinator: AppFireCoordinator):
+        """Initialize the climate entity."""
+        super().__init__(coordinator, context=API_DATA_LOOKUP_STOVE_STATUS)
+        self._attr_unique_id = f"{self.coordinator.stove_serial}_climate"
+
+    @property
+    def min_temp(self) -> float:
+        """Return the minimum temperature reported by the stove."""
+        return self.coordinator.bounds[API_DATA_LOOKUP_DESIRED_AMBIENT_TEMPERATURE][0]
+
+    @property
+    def max_temp(self) -> float:
+        """Return the maximum temperature reported by the stove."""
+        return self.coordinator.bounds[API_DATA_LOOKUP_DESIRED_AMBIENT_TEMPERATURE][1]
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        data = self.coordinator.data
+        self._attr_hvac_mode = (
+            HVACMode.HEAT if data.get(API_DATA_LOOKUP_POWER_STATUS) else HVACMode.OFF
+        )
+        self._attr_hvac_action = HVAC_ACTION_OF_STATUS.get(
+            data.get(API_DATA_LOOKUP_STOVE_STATUS)
+        )
+        self._attr_current_temperature = data.get(API_DATA_LOOKUP_AMBIENT_TEMPERATURE)
+        self._attr_target_temperature = data.get(API_DATA_LOOKUP_DESIRED_AMBIENT_TEMPERATURE)
+        self.async_write_ha_state()
+
+    async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
+        """Turn the stove on or off."""
+        await self.coordinator.async_write_registers(self._encode_hvac_mode(hvac_mode))
+
+    async def async_turn_on(self) -> None:
+        """Turn the stove on."""
+        await self.async_set_hvac_mode(HVACMode.HEAT)
+
+    async def async_turn_off(self) -> None:
+        """Turn the stove off."""
+        await self.async_set_hvac_mode(HVACMode.OFF)
+
+    async def async_set_temperature(self, **kwargs: Any) -> None:
+        """Set the desired ambient temperature, and the mode if given."""
+        # pylint: disable-next=import-outside-toplevel
+        from .lib.appfire_client.message_data_write_request import MessageDataWriteRequest
+
+        registers = []
+        if (temperature := kwargs.get(ATTR_TEMPERATURE)) is not None:
+            self.coordinator.validate_value(
+                API_DATA_LOOKUP_DESIRED_AMBIENT_TEMPERATURE, temperature
+            )
+            registers.append(
+                MessageDataWriteRequest.encodeDesiredAmbientTemperature(temperature)
+            )
+        if (hvac_mode := kwargs.get(ATTR_HVAC_MODE)) is not None:
+            registers.append(self._encode_hvac_mode(hvac_mode))
+        if registers:
+            # Sent in one exchange, followed by one refresh
+            await self.coordinator.async_write_registers(*registers)
+
+    def _encode_hvac_mode(self, hvac_mode: HVACMode) -> tuple[int, int]:
+        """Return the power register write for an HVAC mode."""
+        # pylint: disable-next=import-outside-toplevel
+        from .lib.appfire_client.message_data_write_request import MessageDataWriteRequest
+
+        if hvac_mode not in self._attr_hvac_modes:
+            raise ServiceValidationError(f"Unsupported HVAC mode: {hvac_mode}")
+        return MessageDataWriteRequest.encodePowerStatus(hvac_mode == HVACMode.HEAT)
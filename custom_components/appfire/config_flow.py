@@ -22,11 +22,19 @@ from .const import (
     CONF_IP,
     CONF_PORT,
     CONF_POLLING_INTERVAL,
+    CONF_PROXY_PORT,
+    CONF_RATE_LIMIT,
+    CONF_RATE_BURST,
+    CONF_CALIBRATION_CURVE,
+    DEFAULT_CALIBRATION_CURVE,
     DEFAULT_PORT,
+    DEFAULT_PROXY_PORT,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_RATE_BURST,
     DEFAULT_SCAN_INTERVAL_S,
     DOMAIN,
 )
-from .lib.appfire_client.appfire import AppFire
+from .estimator import parse_calibration_curve
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -106,15 +114,22 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> None:
 
     Data has the keys from STEP_USER_SCHEMA with values provided by the user.
     """
-    appfire = AppFire(data[CONF_IP], data[CONF_PORT])
-
-    if not await hass.async_add_executor_job(appfire.isOnline):
+    if not await hass.async_add_executor_job(_is_online, data[CONF_IP], data[CONF_PORT]):
         raise CannotConnect
 
     # Note: If authentication is added in the future, validate credentials here
     # and raise InvalidAuth on failure.
 
 
+def _is_online(ip: str, port: int) -> bool:
+    """Return True if the stove accepts connections."""
+    # The client is only imported when a flow needs it
+    # pylint: disable-next=import-outside-toplevel
+    from .lib.appfire_client.appfire import AppFire
+
+    return AppFire(ip, port).isOnline()
+
+
 class AppFireOptionsFlow(OptionsFlow):
     """Handle options flow for AppFire."""
 
@@ -125,6 +140,12 @@ class AppFireOptionsFlow(OptionsFlow):
         errors: dict[str, str] = {}
 
         if user_input is not None:
+            try:
+                parse_calibration_curve(user_input[CONF_CALIBRATION_CURVE])
+            except ValueError:
+                errors[CONF_CALIBRATION_CURVE] = "invalid_calibration_curve"
+
+        if user_input is not None and not errors:
             # Validate connection with new settings
             try:
                 await validate_input(self.hass, {
@@ -161,6 +182,22 @@ class AppFireOptionsFlow(OptionsFlow):
                     CONF_POLLING_INTERVAL,
                     default=self.config_entry.data.get(CONF_POLLING_INTERVAL, DEFAULT_SCAN_INTERVAL_S),
                 ): vol.All(vol.Coerce(int), vol.Clamp(min=5)),
+                vol.Required(
+                    CONF_PROXY_PORT,
+                    default=self.config_entry.data.get(CONF_PROXY_PORT, DEFAULT_PROXY_PORT),
+                ): vol.All(vol.Coerce(int), vol.Clamp(min=0), vol.Clamp(max=65535)),
+                vol.Required(
+                    CONF_RATE_LIMIT,
+                    default=self.config_entry.data.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT),
+                ): vol.All(vol.Coerce(int), vol.Clamp(min=1)),
+                vol.Required(
+                    CONF_RATE_BURST,
+                    default=self.config_entry.data.get(CONF_RATE_BURST, DEFAULT_RATE_BURST),
+                ): vol.All(vol.Coerce(int), vol.Clamp(min=1)),
+                vol.Required(
+                    CONF_CALIBRATION_CURVE,
+                    default=self.config_entry.data.get(CONF_CALIBRATION_CURVE, DEFAULT_CALIBRATION_CURVE),
+                ): str,
             }
         )
 
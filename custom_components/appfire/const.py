@@ -10,19 +10,119 @@ CONF_SERIAL = "serial"
 CONF_IP = "ip"
 CONF_PORT = "port"
 CONF_POLLING_INTERVAL = "polling_interval"
+CONF_PROXY_PORT = "proxy_port"
+CONF_RATE_LIMIT = "rate_limit"
+CONF_RATE_BURST = "rate_burst"
+CONF_CALIBRATION_CURVE = "calibration_curve"
 
 DEFAULT_SCAN_INTERVAL_S = 60
 DEFAULT_PORT = 5001
+DEFAULT_PROXY_PORT = 0  # Proxy disabled
+DEFAULT_RATE_LIMIT = 30  # Requests per minute, retries included
+DEFAULT_RATE_BURST = 10
+# Pellet feed rate in kg/h at some power levels, interpolated in between
+DEFAULT_CALIBRATION_CURVE = "0:0.6, 100:2.0"
+
+# Seconds a stove reply is reused for identical reads made through the proxy
+PROXY_CACHE_TTL_S = 2
+
+# Upper bound on stoves contacted at the same time, shared by all entries
+MAX_PARALLEL_CONNECTIONS = 4
+DATA_CONNECTION_LIMITER = f"{DOMAIN}_connection_limiter"
+
+# Consecutive failed updates after which the stove is considered gone.
+# Updates then fail fast, without contacting the stove, while its
+# address is looked for on the local subnet. A single attempt is let
+# through again once the cool-down is over.
+CIRCUIT_BREAKER_THRESHOLD = 3
+CIRCUIT_BREAKER_COOLDOWN_S = 300
+# Stove address -> serial, for every stove seen answering, kept across
+# restarts. The protocol does not report the serial number: a stove is
+# only moved on its own to an address it was seen at, any other address
+# has to be confirmed by the user through a repair issue.
+DATA_STOVE_ADDRESSES = f"{DOMAIN}_stove_addresses"
+DATA_STOVE_ADDRESSES_STORE = f"{DOMAIN}_stove_addresses_store"
+STOVE_ADDRESSES_SAVE_DELAY_S = 10
+ISSUE_STOVE_MOVED = "stove_moved"
+
+# Consumption estimate. Energy is the heat content of the pellets burnt.
+PELLET_ENERGY_KWH_PER_KG = 4.8
+# Longer gaps between two updates are not accounted for
+ESTIMATOR_MAX_GAP_S = 900
+ESTIMATOR_SAVE_DELAY_S = 60
+STORAGE_VERSION = 1
+
+# Anomaly detection on the smoke temperature and fan speed trends
+ANOMALY_EWMA_ALPHA = 0.1
+ANOMALY_Z_THRESHOLD = 3.5
+ANOMALY_WARMUP_SAMPLES = 20
+ANOMALY_CONSECUTIVE_SAMPLES = 2
+EVENT_ANOMALY = f"{DOMAIN}_anomaly"
+
+# Bounds used until the stove reports its own
+DEFAULT_DESIRED_AMBIENT_TEMPERATURE_MIN = 10
+DEFAULT_DESIRED_AMBIENT_TEMPERATURE_MAX = 50
+DEFAULT_DESIRED_MAX_POWER_PERCENTAGE_MIN = 0
+DEFAULT_DESIRED_MAX_POWER_PERCENTAGE_MAX = 100
+
+# Register writes queued within this window are sent in one exchange
+COMMAND_BATCH_WINDOW_S = 0.05
+
+# Fastest interval of the telemetry stream sent to websocket subscribers.
+# Telemetry is not exempt from the rate limiter, which protects the stove:
+# it is slowed down to use at most TELEMETRY_RATE_SHARE of the allowed
+# rate, the rest is left to polls and commands. With the default limit
+# of 30 requests per minute that is one sample every 4 seconds, raise the
+# rate limit for faster telemetry.
+TELEMETRY_INTERVAL_S = 1
+TELEMETRY_RATE_SHARE = 0.5
+
+# Site-wide aggregates over all the stoves
+DATA_AGGREGATOR = f"{DOMAIN}_aggregator"
+
+# Profiling service
+DATA_PROFILER = f"{DOMAIN}_profiler"
+PROFILE_DEFAULT_DURATION_S = 30
+PROFILE_MAX_DURATION_S = 600
+PROFILE_SAMPLE_INTERVAL_S = 0.005
+
+# Protocol pages, each one is a separate request to the stove.
+# Their field layout is described in lib/appfire_client/page_registry.py
+API_DATA_PAGE_PRIMARY = 0
+API_DATA_PAGE_SECONDARY = 2
+# Weekly schedule, re-read after a register write or a crono mode change
+API_DATA_PAGE_CRONO = 3
+
+# Minimum time between two reads of a page. A page is never read more
+# often than the polling interval and not at all if no entity needs it.
+API_DATA_PAGE_MIN_INTERVAL_S = {
+    API_DATA_PAGE_PRIMARY: 0,
+    API_DATA_PAGE_SECONDARY: 300,
+    API_DATA_PAGE_CRONO: 6 * 3600,
+}
+API_DATA_PAGE_DEFAULT_MIN_INTERVAL_S = 300
+# Pages whose layout is not confirmed on every stove model. Failing to
+# read them keeps their previous values instead of failing the update.
+API_DATA_PAGES_OPTIONAL = {API_DATA_PAGE_CRONO}
 
 API_DATA_LOOKUP_STOVE_STATUS = "status"
 API_DATA_LOOKUP_POWER_STATUS = "power_status"
 API_DATA_LOOKUP_ECO_MODE = "eco_mode"
-# API_DATA_LOOKUP_CRONO_MODE = "crono_mode"
+API_DATA_LOOKUP_CRONO_MODE = "crono_mode"
 API_DATA_LOOKUP_AMBIENT_TEMPERATURE = "ambient_temperature"
 API_DATA_LOOKUP_DESIRED_AMBIENT_TEMPERATURE = "desired_ambient_temperature"
 API_DATA_LOOKUP_DESIRED_AMBIENT_TEMPERATURE_MIN = "desired_ambient_temperature_min"
 API_DATA_LOOKUP_DESIRED_AMBIENT_TEMPERATURE_MAX = "desired_ambient_temperature_max"
 API_DATA_LOOKUP_SMOKE_TEMPERATURE = "smoke_temperature"
 API_DATA_LOOKUP_POWER_PERCENTAGE = "power_percentage"
+API_DATA_LOOKUP_DESIRED_MAX_POWER_PERCENTAGE = "desired_max_power_percentage"
+API_DATA_LOOKUP_DESIRED_MAX_POWER_PERCENTAGE_MIN = "desired_max_power_percentage_min"
+API_DATA_LOOKUP_DESIRED_MAX_POWER_PERCENTAGE_MAX = "desired_max_power_percentage_max"
 API_DATA_LOOKUP_SMOKE_FAN_RPM = "smoke_fan_rpm"
 API_DATA_LOOKUP_FAN1_PERCENTAGE = "fan1_percentage"
+API_DATA_LOOKUP_CRONO_SCHEDULE = "crono_schedule"
+
+# Values computed by the integration, next to the ones read from the stove
+ESTIMATE_PELLET_CONSUMED = "pellet_consumed"
+ESTIMATE_ENERGY = "energy"
+ESTIMATE_ANOMALY = "combustion_anomaly"
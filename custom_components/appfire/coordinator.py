@@ -1,30 +1,77 @@
 """Data coordinator for AppFire integration."""
 from __future__ import annotations
 
+import asyncio
+import ipaddress
 import logging
+import math
+import threading
+import time
+from collections.abc import Callable
 from datetime import timedelta
+from functools import cached_property, partial
+from typing import Any
 
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import issue_registry as ir
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
 
 from .const import (
-    API_DATA_LOOKUP_STOVE_STATUS,
-    API_DATA_LOOKUP_POWER_STATUS,
-    API_DATA_LOOKUP_ECO_MODE,
-    API_DATA_LOOKUP_AMBIENT_TEMPERATURE,
+    DOMAIN,
+    CONF_IP,
+    CONF_PORT,
+    CIRCUIT_BREAKER_THRESHOLD,
+    CIRCUIT_BREAKER_COOLDOWN_S,
+    DATA_STOVE_ADDRESSES,
+    DATA_STOVE_ADDRESSES_STORE,
+    STOVE_ADDRESSES_SAVE_DELAY_S,
+    ISSUE_STOVE_MOVED,
+    ESTIMATE_PELLET_CONSUMED,
+    ESTIMATE_ENERGY,
+    ESTIMATE_ANOMALY,
+    EVENT_ANOMALY,
+    ESTIMATOR_SAVE_DELAY_S,
+    API_DATA_PAGE_PRIMARY,
+    API_DATA_PAGE_CRONO,
+    API_DATA_PAGE_MIN_INTERVAL_S,
+    API_DATA_PAGE_DEFAULT_MIN_INTERVAL_S,
+    API_DATA_PAGES_OPTIONAL,
+    COMMAND_BATCH_WINDOW_S,
+    TELEMETRY_INTERVAL_S,
+    TELEMETRY_RATE_SHARE,
+    DEFAULT_DESIRED_AMBIENT_TEMPERATURE_MIN,
+    DEFAULT_DESIRED_AMBIENT_TEMPERATURE_MAX,
+    DEFAULT_DESIRED_MAX_POWER_PERCENTAGE_MIN,
+    DEFAULT_DESIRED_MAX_POWER_PERCENTAGE_MAX,
     API_DATA_LOOKUP_DESIRED_AMBIENT_TEMPERATURE,
     API_DATA_LOOKUP_DESIRED_AMBIENT_TEMPERATURE_MIN,
     API_DATA_LOOKUP_DESIRED_AMBIENT_TEMPERATURE_MAX,
-    API_DATA_LOOKUP_SMOKE_TEMPERATURE,
-    API_DATA_LOOKUP_POWER_PERCENTAGE,
-    API_DATA_LOOKUP_SMOKE_FAN_RPM,
-    API_DATA_LOOKUP_FAN1_PERCENTAGE,
+    API_DATA_LOOKUP_DESIRED_MAX_POWER_PERCENTAGE,
+    API_DATA_LOOKUP_DESIRED_MAX_POWER_PERCENTAGE_MIN,
+    API_DATA_LOOKUP_DESIRED_MAX_POWER_PERCENTAGE_MAX,
+    API_DATA_LOOKUP_CRONO_MODE,
 )
+from .anomaly import AnomalyDetector
+from .scheduler import AppFireRequestScheduler, PollPreempted
 
 _LOGGER = logging.getLogger(__name__)
 
+# Settable values whose bounds are reported by the stove, as (min key, max key)
+BOUNDED_VALUES = {
+    API_DATA_LOOKUP_DESIRED_AMBIENT_TEMPERATURE: (
+        API_DATA_LOOKUP_DESIRED_AMBIENT_TEMPERATURE_MIN,
+        API_DATA_LOOKUP_DESIRED_AMBIENT_TEMPERATURE_MAX,
+    ),
+    API_DATA_LOOKUP_DESIRED_MAX_POWER_PERCENTAGE: (
+        API_DATA_LOOKUP_DESIRED_MAX_POWER_PERCENTAGE_MIN,
+        API_DATA_LOOKUP_DESIRED_MAX_POWER_PERCENTAGE_MAX,
+    ),
+}
 
 class AppFireCoordinator(DataUpdateCoordinator):
     """Coordinator for AppFire stove data updates."""
@@ -42,6 +89,46 @@ class AppFireCoordinator(DataUpdateCoordinator):
         self.api = api
         self.stove_name = stove_name
         self.stove_serial = stove_serial
+        self.scheduler = AppFireRequestScheduler(hass)
+        # pylint: disable-next=import-outside-toplevel
+        from .lib.appfire_client.page_registry import getPageOfField
+
+        # Page each value is read from
+        self._page_of_key = getPageOfField()
+        self._pending_writes: dict[int, int] = {}
+        self._write_batch: asyncio.Future[None] | None = None
+        # Last valid bounds reported by the stove, kept across failed polls
+        self.bounds: dict[str, tuple[float, float]] = {
+            API_DATA_LOOKUP_DESIRED_AMBIENT_TEMPERATURE: (
+                DEFAULT_DESIRED_AMBIENT_TEMPERATURE_MIN,
+                DEFAULT_DESIRED_AMBIENT_TEMPERATURE_MAX,
+            ),
+            API_DATA_LOOKUP_DESIRED_MAX_POWER_PERCENTAGE: (
+                DEFAULT_DESIRED_MAX_POWER_PERCENTAGE_MIN,
+                DEFAULT_DESIRED_MAX_POWER_PERCENTAGE_MAX,
+            ),
+        }
+        # Local connection-sharing proxy, if enabled for this stove
+        self.proxy = None
+        self.rate_limiter = None
+        # Monotonic time of the last successful read of each page
+        self.page_fetched_at: dict[str, float] = {}
+        # Filled by async_setup_entry, reported in diagnostics
+        self.startup_timings: dict[str, Any] = {}
+        # Platforms set up for this stove
+        self.platforms: list[str] = []
+        # Fast polling, only running while someone is subscribed
+        self._telemetry_listeners: list[Callable[[dict], None]] = []
+        self._telemetry_task: asyncio.Task | None = None
+        # Circuit breaker and address rediscovery
+        self.consecutive_failures = 0
+        self.circuit_open_until: float | None = None
+        self._rediscovery_task: asyncio.Task | None = None
+        self._moved_issue_raised = False
+        # Pellet consumption estimate and where it is saved, set by async_setup_entry
+        self.estimator = None
+        self.estimator_store = None
+        self.anomaly_detector = AnomalyDetector()
 
     def get_stove_name_or_serial(self):
         """Return stove name if set, otherwise serial."""
@@ -49,36 +136,463 @@ class AppFireCoordinator(DataUpdateCoordinator):
             return self.stove_name
         return self.stove_serial
 
-    async def _async_update_data(self):
-        """Fetch data from API endpoint."""
+    @cached_property
+    def device_info(self) -> DeviceInfo:
+        """Return device information shared by all the entities of this stove."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self.stove_serial)},
+            name=self.get_stove_name_or_serial(),
+            manufacturer="AppFire",
+            model="Pellet Stove",
+        )
+
+    def validate_value(self, key: str, value: float) -> None:
+        """Reject a value outside the bounds reported by the stove."""
+        min_value, max_value = self.bounds[key]
+        if not min_value <= value <= max_value:
+            raise ServiceValidationError(
+                f"Value {value} for {key} is out of range [{min_value}, {max_value}]"
+            )
+
+    def _update_bounds(self, data: dict) -> None:
+        """Cache the bounds found in freshly fetched data."""
+        for key, (min_key, max_key) in BOUNDED_VALUES.items():
+            min_value = data.get(min_key)
+            max_value = data.get(max_key)
+            if min_value is not None and max_value is not None and min_value < max_value:
+                self.bounds[key] = (min_value, max_value)
+
+    async def async_write_registers(self, *registers: tuple[int, int]) -> None:
+        """Write stove registers, then refresh.
+
+        Writes queued within a short window (e.g. by a scene) are sent to
+        the stove in a single exchange followed by a single refresh.
+        """
+        self._pending_writes.update(registers)
+        if self._write_batch is None:
+            self._write_batch = self.hass.loop.create_future()
+            self.hass.loop.call_later(
+                COMMAND_BATCH_WINDOW_S,
+                lambda: self.hass.async_create_task(self._async_flush_writes()),
+            )
+        await asyncio.shield(self._write_batch)
+
+    async def _async_flush_writes(self) -> None:
+        """Send the queued register writes to the stove."""
+        batch, self._write_batch = self._write_batch, None
+        registers, self._pending_writes = list(self._pending_writes.items()), {}
+
         try:
-            _LOGGER.debug("Fetching data from stove")
+            results = await self.scheduler.async_command(
+                self.api.writeRegisters, registers
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            batch.set_exception(HomeAssistantError(f"Error communicating with API: {err}"))
+            return
+
+        # The writes may have changed the schedule
+        self.page_fetched_at.pop(API_DATA_PAGE_CRONO, None)
+        await self.async_request_refresh()
+
+        if all(results):
+            batch.set_result(None)
+            return
 
-            primary_data = await self.hass.async_add_executor_job(
-                self.api.getMessageInfo
+        written = [index for (index, _), ok in zip(registers, results) if ok]
+        refused = [index for (index, _), ok in zip(registers, results) if ok is False]
+        unconfirmed = [index for (index, _), ok in zip(registers, results) if ok is None]
+        batch.set_exception(
+            HomeAssistantError(
+                f"Registers {written} written, {refused} refused by the stove, "
+                f"{unconfirmed} not confirmed (no valid response from stove)"
             )
-            if primary_data is None:
-                raise UpdateFailed("Failed to get primary data from stove (checksum error or no response)")
+        )
+
+    @property
+    def telemetry_subscribers(self) -> int:
+        """Return the number of telemetry subscribers."""
+        return len(self._telemetry_listeners)
+
+    @property
+    def telemetry_interval_s(self) -> float:
+        """Return the telemetry interval, slowed down to its share of the rate limit."""
+        if self.rate_limiter is None:
+            return TELEMETRY_INTERVAL_S
+        return max(
+            TELEMETRY_INTERVAL_S, 1 / (self.rate_limiter.rate * TELEMETRY_RATE_SHARE)
+        )
+
+    @callback
+    def async_subscribe_telemetry(
+        self, listener: Callable[[dict], None]
+    ) -> Callable[[], None]:
+        """Stream decoded samples to the listener until unsubscribed.
+
+        Samples are not stored in the coordinator data, so entities keep
+        updating at the polling interval.
+        """
+        self._telemetry_listeners.append(listener)
+        if self._telemetry_task is None:
+            _LOGGER.debug("Starting telemetry for %s", self.stove_serial)
+            self._telemetry_task = self.hass.async_create_background_task(
+                self._async_telemetry_loop(), f"{DOMAIN} telemetry {self.stove_serial}"
+            )
+
+        @callback
+        def unsubscribe() -> None:
+            if listener in self._telemetry_listeners:
+                self._telemetry_listeners.remove(listener)
+            if not self._telemetry_listeners:
+                self.async_stop_telemetry()
+
+        return unsubscribe
+
+    @callback
+    def async_stop_telemetry(self) -> None:
+        """Stop the telemetry stream and drop its listeners."""
+        self._telemetry_listeners.clear()
+        if self._telemetry_task is not None:
+            _LOGGER.debug("Stopping telemetry for %s", self.stove_serial)
+            self._telemetry_task.cancel()
+            self._telemetry_task = None
+
+    async def _async_telemetry_loop(self) -> None:
+        """Read the primary page at the telemetry interval."""
+        while True:
+            started = time.monotonic()
+            try:
+                if self.circuit_open_until is not None and started < self.circuit_open_until:
+                    # Left alone like the polls until it is found again
+                    sample = None
+                else:
+                    page_data = await self.scheduler.async_poll(self._read_fresh_primary_page)
+                    sample = page_data.decode() if page_data is not None else None
+            except PollPreempted:
+                sample = None
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.debug("Telemetry read failed: %s", err)
+                sample = None
+
+            if sample is not None:
+                for listener in list(self._telemetry_listeners):
+                    listener(sample)
+
+            await asyncio.sleep(
+                max(0.0, self.telemetry_interval_s - (time.monotonic() - started))
+            )
+
+    def _read_fresh_primary_page(self, cancel_event: threading.Event):
+        """Read the primary page, bypassing the proxy cache if there is one.
+
+        Runs in the executor. The proxy lives on the event loop, it is asked
+        directly instead of over its socket.
+        """
+        if self.proxy is None:
+            return self.api.readPage(API_DATA_PAGE_PRIMARY, cancel_event)
+
+        # pylint: disable-next=import-outside-toplevel
+        from .lib.appfire_client.message import ChecksumError
+        # pylint: disable-next=import-outside-toplevel
+        from .lib.appfire_client.message_data_page_read_request import (
+            MessageDataPageReadRequest,
+        )
+        # pylint: disable-next=import-outside-toplevel
+        from .lib.appfire_client.message_data_page_read_response import (
+            MessageDataPageReadResponse,
+        )
+
+        request = MessageDataPageReadRequest(API_DATA_PAGE_PRIMARY)
+        reply = asyncio.run_coroutine_threadsafe(
+            self.proxy.forward(request.rawData, useCache=False), self.hass.loop
+        ).result()
+        if reply is None:
+            return None
+        try:
+            return MessageDataPageReadResponse(reply, API_DATA_PAGE_PRIMARY)
+        except ChecksumError:
+            return None
+
+    def _get_pages_to_fetch(self) -> list[int]:
+        """Return the pages that are needed by an entity and due for a read."""
+        if self.data is None:
+            # First refresh, entities are not subscribed yet
+            return [API_DATA_PAGE_PRIMARY]
 
-            secondary_data = await self.hass.async_add_executor_job(
-                self.api.getMessage2Info
+        # Listeners without a known value key get the primary page
+        needed = {
+            self._page_of_key.get(key, API_DATA_PAGE_PRIMARY)
+            for key in self.async_contexts()
+        }
+        now = time.monotonic()
+        # Tolerates the jitter of the polling schedule
+        tolerance_s = self.update_interval.total_seconds() / 2
+        return [
+            page
+            for page in sorted(needed)
+            if now - self.page_fetched_at.get(page, -math.inf) + tolerance_s
+            >= API_DATA_PAGE_MIN_INTERVAL_S.get(page, API_DATA_PAGE_DEFAULT_MIN_INTERVAL_S)
+        ]
+
+    @property
+    def stove_address(self) -> tuple[str, int]:
+        """Return the address of the stove itself, from the entry data.
+
+        With the proxy enabled, the client talks to the proxy instead but
+        this stays the stove's own address.
+        """
+        return self.config_entry.data[CONF_IP], self.config_entry.data[CONF_PORT]
+
+    @callback
+    def _async_record_failure(self) -> None:
+        """Open the circuit after too many failed updates."""
+        self.consecutive_failures += 1
+        if self.consecutive_failures < CIRCUIT_BREAKER_THRESHOLD:
+            return
+
+        self.circuit_open_until = time.monotonic() + CIRCUIT_BREAKER_COOLDOWN_S
+        if self._rediscovery_task is None:
+            _LOGGER.warning(
+                "Stove %s unreachable after %s attempts, looking for it on the local network",
+                self.stove_serial,
+                self.consecutive_failures,
+            )
+            self._rediscovery_task = self.hass.async_create_background_task(
+                self._async_rediscover(), f"{DOMAIN} rediscovery {self.stove_serial}"
             )
-            if secondary_data is None:
-                raise UpdateFailed("Failed to get secondary data from stove (checksum error or no response)")
-
-            return {
-                API_DATA_LOOKUP_STOVE_STATUS: primary_data.getStatus(),
-                API_DATA_LOOKUP_POWER_STATUS: primary_data.isOn(),
-                API_DATA_LOOKUP_ECO_MODE: primary_data.isEcoMode(),
-                API_DATA_LOOKUP_AMBIENT_TEMPERATURE: primary_data.getAmbientTemperature(),
-                API_DATA_LOOKUP_DESIRED_AMBIENT_TEMPERATURE: primary_data.getDesiredAmbientTemperature(),
-                API_DATA_LOOKUP_DESIRED_AMBIENT_TEMPERATURE_MIN: primary_data.getDesiredAmbientTemperatureMin(),
-                API_DATA_LOOKUP_DESIRED_AMBIENT_TEMPERATURE_MAX: primary_data.getDesiredAmbientTemperatureMax(),
-                API_DATA_LOOKUP_SMOKE_TEMPERATURE: primary_data.getSmokeTemperature(),
-                API_DATA_LOOKUP_POWER_PERCENTAGE: primary_data.getPowerPercentage(),
-                API_DATA_LOOKUP_SMOKE_FAN_RPM: primary_data.getSmokeFanRpm(),
-                API_DATA_LOOKUP_FAN1_PERCENTAGE: secondary_data.getFan1Percentage(),
+
+    @callback
+    def async_stop_rediscovery(self) -> None:
+        """Stop looking for the stove address."""
+        if self._rediscovery_task is not None:
+            self._rediscovery_task.cancel()
+            self._rediscovery_task = None
+
+    async def _async_rediscover(self) -> None:
+        """Scan the subnet of the stove for its new address."""
+        # Rarely needed, not worth importing with the integration
+        # pylint: disable-next=import-outside-toplevel
+        from .lib.appfire_client.discovery import scanHosts
+
+        try:
+            ip, port = self.stove_address
+            addresses: dict[str, str] = self.hass.data.setdefault(DATA_STOVE_ADDRESSES, {})
+            # Addresses of the other stoves that are still answering there
+            claimed = {
+                coordinator.stove_address[0]
+                for coordinator in self.hass.data.get(DOMAIN, {}).values()
+                if coordinator is not self and coordinator.last_update_success
             }
+            try:
+                network = ipaddress.IPv4Network(f"{ip}/24", strict=False)
+            except ValueError:
+                _LOGGER.warning("Cannot scan for stove %s, %s is not an IPv4 address", self.stove_serial, ip)
+                return
+            hosts = [str(host) for host in network.hosts() if str(host) not in claimed]
+            found = await scanHosts(hosts, port)
+            new_ip = self._pick_address(found, addresses)
+            if new_ip is None:
+                # Not known to belong to another stove
+                candidates = sorted(
+                    candidate
+                    for candidate in found
+                    if addresses.get(candidate, self.stove_serial) == self.stove_serial
+                )
+                _LOGGER.warning(
+                    "Stove %s not found on %s.0/24, candidates: %s",
+                    self.stove_serial,
+                    ip.rsplit(".", 1)[0],
+                    candidates,
+                )
+                if candidates:
+                    self._async_raise_moved_issue(candidates)
+                return
+
+            if new_ip != ip:
+                _LOGGER.warning("Stove %s found at %s, was %s", self.stove_serial, new_ip, ip)
+                self._async_set_stove_ip(new_ip)
+            # Let the next update through right away
+            self.circuit_open_until = None
+            await self.async_request_refresh()
+        finally:
+            self._rediscovery_task = None
+
+    def _pick_address(self, found: dict[str, dict], addresses: dict[str, str]) -> str | None:
+        """Return the address of this stove among the ones that answered.
+
+        Any stove answers the same way, another one on the subnet cannot be
+        told apart from this one. Only the configured address and the ones
+        this stove was seen at are trusted.
+        """
+        ip, _ = self.stove_address
+        if ip in found:
+            # Back where it was, the outage was not an address change
+            return ip
+        known = [candidate for candidate in found if addresses.get(candidate) == self.stove_serial]
+        if len(known) == 1:
+            return known[0]
+        return None
+
+    @callback
+    def _async_raise_moved_issue(self, candidates: list[str]) -> None:
+        """Ask the user which of the stoves that answered is this one."""
+        ip, _ = self.stove_address
+        ir.async_create_issue(
+            self.hass,
+            DOMAIN,
+            f"{ISSUE_STOVE_MOVED}_{self.config_entry.entry_id}",
+            is_fixable=True,
+            severity=ir.IssueSeverity.WARNING,
+            translation_key=ISSUE_STOVE_MOVED,
+            translation_placeholders={
+                "stove": self.get_stove_name_or_serial(),
+                "ip": ip,
+                "candidates": ", ".join(candidates),
+            },
+            data={
+                "entry_id": self.config_entry.entry_id,
+                "candidates": ",".join(candidates),
+            },
+        )
+        self._moved_issue_raised = True
+
+    @callback
+    def async_confirm_stove_ip(self, new_ip: str) -> None:
+        """Move the stove to an address confirmed by the user."""
+        _LOGGER.warning("Stove %s moved to %s by the user", self.stove_serial, new_ip)
+        self._async_remember_address(new_ip)
+        self._async_set_stove_ip(new_ip)
+        self.circuit_open_until = None
+        self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def _async_remember_address(self, ip: str) -> None:
+        """Record that this stove answers at the address."""
+        addresses: dict[str, str] = self.hass.data.setdefault(DATA_STOVE_ADDRESSES, {})
+        if addresses.get(ip) == self.stove_serial:
+            return
+        addresses[ip] = self.stove_serial
+        if (store := self.hass.data.get(DATA_STOVE_ADDRESSES_STORE)) is not None:
+            store.async_delay_save(lambda: dict(addresses), STOVE_ADDRESSES_SAVE_DELAY_S)
+
+    @callback
+    def _async_set_stove_ip(self, new_ip: str) -> None:
+        """Talk to the stove at its new address and store it in the entry."""
+        if self.proxy is not None:
+            self.proxy.setStoveAddress(new_ip)
+        else:
+            self.api.ip = new_ip
+        # The entry is not reloaded, entities and connections are kept
+        self.hass.config_entries.async_update_entry(
+            self.config_entry, data={**self.config_entry.data, CONF_IP: new_ip}
+        )
+
+    async def _async_update_data(self):
+        """Fetch data from API endpoint, unless the stove is known to be unreachable."""
+        if self.circuit_open_until is not None and time.monotonic() < self.circuit_open_until:
+            raise UpdateFailed("Stove unreachable, looking for its address on the local network")
+
+        try:
+            data = await self._async_fetch_data()
+        except UpdateFailed:
+            self._async_record_failure()
+            raise
+
+        self.consecutive_failures = 0
+        self.circuit_open_until = None
+        ip, _ = self.stove_address
+        self._async_remember_address(ip)
+        if self._moved_issue_raised:
+            ir.async_delete_issue(
+                self.hass, DOMAIN, f"{ISSUE_STOVE_MOVED}_{self.config_entry.entry_id}"
+            )
+            self._moved_issue_raised = False
+
+        if self.estimator is not None:
+            self.estimator.update(time.time(), data)
+            data[ESTIMATE_PELLET_CONSUMED] = self.estimator.pellet_kg
+            data[ESTIMATE_ENERGY] = self.estimator.energy_kwh
+            self.estimator_store.async_delay_save(
+                self.estimator.as_dict, ESTIMATOR_SAVE_DELAY_S
+            )
+
+        if data is not self.data:
+            for key in self.anomaly_detector.update(data):
+                _LOGGER.warning(
+                    "Stove %s: %s is drifting from its trend (%s)",
+                    self.stove_serial,
+                    key,
+                    data.get(key),
+                )
+                self.hass.bus.async_fire(
+                    EVENT_ANOMALY,
+                    {
+                        "serial": self.stove_serial,
+                        "key": key,
+                        "value": data.get(key),
+                        **self.anomaly_detector.as_dict()[key],
+                    },
+                )
+            data[ESTIMATE_ANOMALY] = self.anomaly_detector.is_anomalous
+        return data
+
+    async def _async_fetch_optional_page(self, page: int, data: dict) -> None:
+        """Read a page that not every stove may answer, keeping old values on failure."""
+        # Not retried before its interval, whatever the outcome
+        self.page_fetched_at[page] = time.monotonic()
+        try:
+            page_data = await self.scheduler.async_poll(partial(self.api.readPage, page))
+            values = page_data.decode() if page_data is not None else None
+        except PollPreempted:
+            # Given way to a command, read again at the next poll
+            self.page_fetched_at.pop(page)
+            return
+        except ValueError as err:
+            _LOGGER.debug("Cannot decode page %s: %s", page, err)
+            return
+        if values is None:
+            _LOGGER.debug("No valid reply for page %s, keeping previous values", page)
+            return
+        # A short or blank reply decodes to None, keep the cached value instead
+        data.update({key: value for key, value in values.items() if value is not None})
+
+    async def _async_fetch_data(self):
+        """Fetch data from API endpoint."""
+        try:
+            pages = self._get_pages_to_fetch()
+            _LOGGER.debug("Fetching pages %s from stove", pages)
+
+            # Values of the pages not fetched this time are kept
+            data = dict(self.data) if self.data is not None else {}
+
+            for page in pages:
+                if page in API_DATA_PAGES_OPTIONAL:
+                    await self._async_fetch_optional_page(page, data)
+                    continue
+                page_data = await self.scheduler.async_poll(
+                    partial(self.api.readPage, page)
+                )
+                if page_data is None:
+                    raise UpdateFailed(f"Failed to get page {page} from stove (checksum error or no response)")
+                self.page_fetched_at[page] = time.monotonic()
+                data.update(page_data.decode())
+
+            if (
+                self.data is not None
+                and data.get(API_DATA_LOOKUP_CRONO_MODE)
+                != self.data.get(API_DATA_LOOKUP_CRONO_MODE)
+            ):
+                # Changed on the stove itself, the schedule may have too
+                self.page_fetched_at.pop(API_DATA_PAGE_CRONO, None)
+
+            self._update_bounds(data)
+            return data
+
+        except PollPreempted as err:
+            # A command took the stove over, it requests a refresh on completion
+            if self.data is None:
+                raise UpdateFailed("Poll interrupted by a command") from err
+            _LOGGER.debug("Poll interrupted by a command, keeping previous data")
+            return self.data
 
         except Exception as err:
             # Note: If authentication is added in the future, catch the auth error
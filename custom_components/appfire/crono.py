@@ -0,0 +1,63 @@
+"""Weekly crono schedule of AppFire stoves, as dates."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+
+def format_minutes(minutes: int) -> str:
+    """Return minutes since midnight as HH:MM."""
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def iter_slots(
+    schedule: list[dict[str, Any]], start: datetime, end: datetime
+) -> Iterator[tuple[datetime, datetime]]:
+    """Yield the slots of the schedule overlapping [start, end), in order.
+
+    Slot times are local to the stove, taken as the Home Assistant time zone.
+    """
+    # Slots of the day before may run past midnight
+    day = dt_util.as_local(start).date() - timedelta(days=1)
+    last_day = dt_util.as_local(end).date()
+    while day <= last_day:
+        midnight = dt_util.start_of_local_day(day)
+        for slot in sorted(
+            (slot for slot in schedule if slot["day"] == day.weekday()),
+            key=lambda slot: slot["start"],
+        ):
+            slot_start = midnight + timedelta(minutes=slot["start"])
+            slot_end = midnight + timedelta(minutes=slot["stop"])
+            if slot_end <= slot_start:
+                slot_end += timedelta(days=1)
+            if slot_start < end and slot_end > start:
+                yield slot_start, slot_end
+        day += timedelta(days=1)
+
+
+def next_start(schedule: list[dict[str, Any]] | None) -> datetime | None:
+    """Return when the next slot of the schedule starts."""
+    if not schedule:
+        return None
+    now = dt_util.now()
+    for slot_start, _ in iter_slots(schedule, now, now + timedelta(days=8)):
+        if slot_start > now:
+            return slot_start
+    return None
+
+
+def schedule_by_day(schedule: list[dict[str, Any]] | None) -> dict[str, list[str]]:
+    """Return the slots of each weekday as HH:MM-HH:MM."""
+    return {
+        weekday: [
+            f"{format_minutes(slot['start'])}-{format_minutes(slot['stop'])}"
+            for slot in sorted(schedule or [], key=lambda slot: slot["start"])
+            if slot["day"] == day
+        ]
+        for day, weekday in enumerate(WEEKDAYS)
+    }
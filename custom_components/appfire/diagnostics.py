@@ -27,4 +27,18 @@ async def async_get_config_entry_diagnostics(
             "last_update_success": coordinator.last_update_success,
             "data": coordinator.data,
         },
+        "bounds": coordinator.bounds,
+        "page_fetched_at": coordinator.page_fetched_at,
+        "startup": coordinator.startup_timings,
+        "scheduler": coordinator.scheduler.as_dict(),
+        "telemetry_subscribers": coordinator.telemetry_subscribers,
+        "anomaly_detector": coordinator.anomaly_detector.as_dict(),
+        "circuit": {
+            "consecutive_failures": coordinator.consecutive_failures,
+            "open": coordinator.circuit_open_until is not None,
+        },
+        "replies": coordinator.api.pendingRequests.getStats(),
+        "frames": coordinator.api.frameTrace.getEntries(),
+        "rate_limiter": coordinator.rate_limiter.getStats(),
+        "proxy": coordinator.proxy.getStats() if coordinator.proxy is not None else None,
     }
@@ -0,0 +1,96 @@
+"""Pellet consumption and energy estimator for AppFire stoves."""
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import Any
+
+from .const import (
+    API_DATA_LOOKUP_POWER_PERCENTAGE,
+    API_DATA_LOOKUP_STOVE_STATUS,
+    ESTIMATOR_MAX_GAP_S,
+    PELLET_ENERGY_KWH_PER_KG,
+)
+from .lib.appfire_client.status.stove_status import StoveStatus
+
+# Statuses in which the stove feeds and burns pellets
+BURNING_STATUSES = {
+    StoveStatus.START_BURNING,
+    StoveStatus.STABILIZATION,
+    StoveStatus.ON,
+    StoveStatus.WARNING_LOW_PELLET,
+}
+
+
+def parse_calibration_curve(curve: str) -> list[tuple[float, float]]:
+    """Parse "power%:kg/h" points separated by commas, e.g. "0:0.6, 100:2.0".
+
+    Raises ValueError if the curve is not valid.
+    """
+    points = []
+    for point in curve.split(","):
+        power, rate = point.split(":")
+        points.append((float(power), float(rate)))
+    points.sort()
+    if not points or any(rate < 0 for _, rate in points):
+        raise ValueError(f"Invalid calibration curve: {curve}")
+    if len({power for power, _ in points}) != len(points):
+        raise ValueError(f"Duplicate power level in calibration curve: {curve}")
+    return points
+
+
+class PelletEstimator:
+    """Integrate the pellet feed rate over time.
+
+    The feed rate at each power level is interpolated from the calibration
+    curve of the stove. Each update only accounts for the time since the
+    previous one, at the rate that was in effect then.
+    """
+
+    def __init__(self, curve: list[tuple[float, float]]) -> None:
+        """Initialize the estimator."""
+        self._powers = [power for power, _ in curve]
+        self._rates = [rate for _, rate in curve]
+        self.pellet_kg = 0.0
+        self._last_update: float | None = None
+        self._last_rate_kg_h = 0.0
+
+    @property
+    def energy_kwh(self) -> float:
+        """Return the energy content of the pellets burnt."""
+        return self.pellet_kg * PELLET_ENERGY_KWH_PER_KG
+
+    def feed_rate_kg_h(self, power_percentage: float) -> float:
+        """Return the feed rate at a power level, clamped to the curve ends."""
+        index = bisect_right(self._powers, power_percentage)
+        if index == 0:
+            return self._rates[0]
+        if index == len(self._powers):
+            return self._rates[-1]
+        low_power, high_power = self._powers[index - 1], self._powers[index]
+        low_rate, high_rate = self._rates[index - 1], self._rates[index]
+        return low_rate + (high_rate - low_rate) * (power_percentage - low_power) / (
+            high_power - low_power
+        )
+
+    def update(self, now: float, data: dict[str, Any]) -> None:
+        """Account for the time since the previous update."""
+        if self._last_update is not None:
+            elapsed_s = now - self._last_update
+            # Nothing is known about long gaps, e.g. the stove was unreachable
+            if 0 < elapsed_s <= ESTIMATOR_MAX_GAP_S:
+                self.pellet_kg += self._last_rate_kg_h * elapsed_s / 3600
+
+        power_percentage = data.get(API_DATA_LOOKUP_POWER_PERCENTAGE)
+        if data.get(API_DATA_LOOKUP_STOVE_STATUS) in BURNING_STATUSES and power_percentage is not None:
+            self._last_rate_kg_h = self.feed_rate_kg_h(power_percentage)
+        else:
+            self._last_rate_kg_h = 0.0
+        self._last_update = now
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the totals to be stored."""
+        return {"pellet_kg": self.pellet_kg}
+
+    def restore(self, stored: dict[str, Any]) -> None:
+        """Restore the totals, the time in between is not accounted for."""
+        self.pellet_kg = stored.get("pellet_kg", 0.0)
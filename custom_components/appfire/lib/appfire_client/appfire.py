@@ -1,6 +1,9 @@
 import logging
+import threading
 
 from .communication import Communication
+from .correlation import PendingRequests
+from .frame_trace import FrameTrace
 from .message import ChecksumError
 from .message_data_read_request import MessageDataReadRequest
 from .message_data_read_response import MessageDataReadResponse
@@ -8,6 +11,9 @@ from .message_data_write_request import MessageDataWriteRequest
 from .message_data_write_response import MessageDataWriteResponse
 from .message_data2_read_request import MessageData2ReadRequest
 from .message_data2_read_response import MessageData2ReadResponse
+from .message_data_page_read_request import MessageDataPageReadRequest
+from .message_data_page_read_response import MessageDataPageReadResponse
+from .rate_limiter import TokenBucket
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -16,14 +22,44 @@ _LOGGER = logging.getLogger(__name__)
 class AppFire:
     """AppFire integration."""
 
-    def __init__(self, ip, port):
+    def __init__(
+        self,
+        ip,
+        port,
+        rateLimiter: TokenBucket = None,
+        maxAttempts: int = None,
+        timeout: float = None,
+    ):
         """Initialize AppFire."""
         self.ip = ip
         self.port = port
+        self.rateLimiter = rateLimiter
+        # Attempts per request and wait for each reply, the Communication
+        # defaults if None
+        self.maxAttempts = maxAttempts
+        self.timeout = timeout
+        # Shared by every request sent to this stove
+        self.pendingRequests = PendingRequests()
+        # Last frames exchanged, for diagnostics
+        self.frameTrace = FrameTrace()
 
-    def getMessageInfo(self) -> MessageDataReadResponse:
+    def getMessageInfo(
+        self, cancelEvent: threading.Event = None
+    ) -> MessageDataReadResponse:
         message = MessageDataReadRequest()
-        response = Communication.sendMessage(self.ip, self.port, message)
+        response = Communication.sendMessage(
+            self.ip,
+            self.port,
+            message,
+            cancelEvent,
+            self.pendingRequests,
+            self.rateLimiter,
+            self.frameTrace,
+            maxAttempts=self.maxAttempts,
+            timeout=self.timeout,
+        )
+        if response is None:
+            return None
 
         try:
             info = MessageDataReadResponse(response)
@@ -33,9 +69,23 @@ class AppFire:
         else:
             return info
 
-    def getMessage2Info(self) -> MessageData2ReadResponse:
+    def getMessage2Info(
+        self, cancelEvent: threading.Event = None
+    ) -> MessageData2ReadResponse:
         message = MessageData2ReadRequest()
-        response = Communication.sendMessage(self.ip, self.port, message)
+        response = Communication.sendMessage(
+            self.ip,
+            self.port,
+            message,
+            cancelEvent,
+            self.pendingRequests,
+            self.rateLimiter,
+            self.frameTrace,
+            maxAttempts=self.maxAttempts,
+            timeout=self.timeout,
+        )
+        if response is None:
+            return None
 
         try:
             info = MessageData2ReadResponse(response)
@@ -45,6 +95,32 @@ class AppFire:
         else:
             return info
 
+    def readPage(
+        self, page: int, cancelEvent: threading.Event = None
+    ) -> MessageDataPageReadResponse:
+        message = MessageDataPageReadRequest(page)
+        response = Communication.sendMessage(
+            self.ip,
+            self.port,
+            message,
+            cancelEvent,
+            self.pendingRequests,
+            self.rateLimiter,
+            self.frameTrace,
+            maxAttempts=self.maxAttempts,
+            timeout=self.timeout,
+        )
+        if response is None:
+            return None
+
+        try:
+            info = MessageDataPageReadResponse(response, page)
+        except ChecksumError as e:
+            _LOGGER.error(f"Message error: {str(e)}")
+            return None
+        else:
+            return info
+
     def isOnline(self) -> bool:
         return Communication.isOnline(self.ip, self.port)
 
@@ -52,7 +128,16 @@ class AppFire:
         messageTurnOn = MessageDataWriteRequest(
             MessageDataWriteRequest.buildRawDataSetPowerStatus(True)
         )
-        response = Communication.sendMessage(self.ip, self.port, messageTurnOn)
+        response = Communication.sendMessage(
+            self.ip,
+            self.port,
+            messageTurnOn,
+            pendingRequests=self.pendingRequests,
+            rateLimiter=self.rateLimiter,
+            frameTrace=self.frameTrace,
+            maxAttempts=self.maxAttempts,
+            timeout=self.timeout,
+        )
 
         try:
             writeResponse = MessageDataWriteResponse(response)
@@ -67,7 +152,16 @@ class AppFire:
         messageTurnOff = MessageDataWriteRequest(
             MessageDataWriteRequest.buildRawDataSetPowerStatus(False)
         )
-        response = Communication.sendMessage(self.ip, self.port, messageTurnOff)
+        response = Communication.sendMessage(
+            self.ip,
+            self.port,
+            messageTurnOff,
+            pendingRequests=self.pendingRequests,
+            rateLimiter=self.rateLimiter,
+            frameTrace=self.frameTrace,
+            maxAttempts=self.maxAttempts,
+            timeout=self.timeout,
+        )
 
         try:
             writeResponse = MessageDataWriteResponse(response)
@@ -85,7 +179,14 @@ class AppFire:
             )
         )
         response = Communication.sendMessage(
-            self.ip, self.port, messageSetDesiredAmbientTemperature
+            self.ip,
+            self.port,
+            messageSetDesiredAmbientTemperature,
+            pendingRequests=self.pendingRequests,
+            rateLimiter=self.rateLimiter,
+            frameTrace=self.frameTrace,
+            maxAttempts=self.maxAttempts,
+            timeout=self.timeout,
         )
 
         try:
@@ -96,3 +197,60 @@ class AppFire:
         else:
             if not writeResponse.isWriteSuccessful():
                 raise Exception("Failed to set desired ambient temperature")
+
+    def writeRegisters(
+        self, registers: list[tuple[int, int]], bulk: bool = False
+    ) -> list[bool]:
+        # Writes several (index, value) pairs in one exchange. By default a
+        # frame per register is sent on a single connection, bulk=True packs
+        # all pairs in one frame for stoves that accept it. Returns, for each
+        # register, True if the stove confirmed the write, False if it
+        # refused it and None if no valid reply came.
+        if bulk:
+            messages = [
+                MessageDataWriteRequest(
+                    MessageDataWriteRequest.buildRawDataSetRegisters(registers)
+                )
+            ]
+        else:
+            messages = [
+                MessageDataWriteRequest(
+                    MessageDataWriteRequest.buildRawDataSetRegisters([register])
+                )
+                for register in registers
+            ]
+
+        responses = Communication.sendMessages(
+            self.ip,
+            self.port,
+            messages,
+            pendingRequests=self.pendingRequests,
+            rateLimiter=self.rateLimiter,
+            frameTrace=self.frameTrace,
+            maxAttempts=self.maxAttempts,
+            timeout=self.timeout,
+        )
+
+        writeResponses = []
+        for response in responses:
+            try:
+                writeResponses.append(
+                    None if response is None else MessageDataWriteResponse(response)
+                )
+            except ChecksumError as e:
+                _LOGGER.error(f"Message error: {str(e)}")
+                writeResponses.append(None)
+
+        if bulk:
+            if writeResponses[0] is None:
+                return [None] * len(registers)
+            results = writeResponses[0].getRegisterResults()
+            if len(results) == 1 and len(registers) > 1:
+                # A single status for the whole frame
+                results = results * len(registers)
+            # Registers left out of the reply are not confirmed
+            return results[: len(registers)] + [None] * (len(registers) - len(results))
+        return [
+            None if writeResponse is None else writeResponse.isWriteSuccessful()
+            for writeResponse in writeResponses
+        ]
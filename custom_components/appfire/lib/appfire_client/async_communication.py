@@ -0,0 +1,74 @@
+import asyncio
+import logging
+
+from .correlation import PendingRequests
+from .message import Message
+from .rate_limiter import TokenBucket
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AsyncCommunication:
+    # asyncio counterpart of Communication, for callers that talk to many
+    # stoves at once from a single event loop
+
+    SOCKET_TIMEOUT_S = 5
+
+    @staticmethod
+    async def sendMessage(
+        ip: str,
+        port: int,
+        message: Message,
+        pendingRequests: PendingRequests = None,
+        rateLimiter: TokenBucket = None,
+        maxAttempts: int = 3,
+        timeout: float = SOCKET_TIMEOUT_S,
+    ) -> bytes:
+        if pendingRequests is None:
+            pendingRequests = PendingRequests()
+
+        for attempt in range(1, maxAttempts + 1):
+            if rateLimiter is not None:
+                wait = rateLimiter.reserve()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+            messageId = pendingRequests.register()
+            frame = Message.replaceMessageId(message.rawData, messageId)
+            writer = None
+            try:
+                reader, writer = await asyncio.wait_for(
+                    asyncio.open_connection(ip, port), timeout
+                )
+                writer.write(frame + b"\n")
+                await writer.drain()
+                return await asyncio.wait_for(
+                    AsyncCommunication._readReply(reader, messageId, pendingRequests),
+                    timeout,
+                )
+
+            except (OSError, asyncio.TimeoutError, ConnectionError) as e:
+                pendingRequests.expire(messageId)
+                _LOGGER.debug(f"{ip}:{port} attempt {attempt} of {maxAttempts} failed: {str(e)}")
+                if attempt < maxAttempts:
+                    await asyncio.sleep(1)
+
+            finally:
+                if writer is not None:
+                    writer.close()
+
+        return None
+
+    @staticmethod
+    async def _readReply(reader, messageId: str, pendingRequests: PendingRequests) -> bytes:
+        buffer = b""
+        while True:
+            data = await reader.read(1024)
+            if not data:
+                raise ConnectionError("Stove closed the connection")
+            frames, buffer = Message.splitFrames(buffer + data)
+            for frame in frames:
+                replyId = Message.frameMessageId(frame)
+                found, _ = pendingRequests.resolve(replyId)
+                if found and replyId == messageId:
+                    return frame
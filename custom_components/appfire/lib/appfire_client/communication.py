@@ -1,14 +1,23 @@
 import socket
+import threading
 import time
 import logging
 
+from .correlation import PendingRequests
+from .frame_trace import FrameTrace
 from .message_data_read_request import MessageDataReadRequest
 from .message import Message
+from .rate_limiter import TokenBucket
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class Communication:
+    SOCKET_TIMEOUT_S = 5
+    MAX_ATTEMPTS = 5
+    # How often a wait for a reply checks the cancel event
+    CANCEL_CHECK_S = 1
+
     @staticmethod
     def isOnline(ip: str, port: int) -> bool:
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
@@ -20,26 +29,174 @@ class Communication:
                 return False
 
     @staticmethod
-    def sendMessage(ip: str, port: int, message: Message) -> float:
+    def sendMessage(
+        ip: str,
+        port: int,
+        message: Message,
+        cancelEvent: threading.Event = None,
+        pendingRequests: PendingRequests = None,
+        rateLimiter: TokenBucket = None,
+        frameTrace: FrameTrace = None,
+        maxAttempts: int = None,
+        timeout: float = None,
+    ) -> bytes:
+        responses = Communication.sendMessages(
+            ip,
+            port,
+            [message],
+            cancelEvent,
+            pendingRequests,
+            rateLimiter,
+            frameTrace,
+            maxAttempts,
+            timeout,
+        )
+        return None if responses is None else responses[0]
+
+    @staticmethod
+    def sendMessages(
+        ip: str,
+        port: int,
+        messages: list[Message],
+        cancelEvent: threading.Event = None,
+        pendingRequests: PendingRequests = None,
+        rateLimiter: TokenBucket = None,
+        frameTrace: FrameTrace = None,
+        maxAttempts: int = None,
+        timeout: float = None,
+    ) -> list[bytes]:
+        # Sends the frames one at a time on one connection, each one once
+        # the previous is answered. Every frame is stamped with a fresh
+        # message ID and each reply is matched to its request by ID, so a
+        # late reply to an earlier attempt is dropped instead of being taken
+        # as the answer.
+        #
+        # Some stoves answer a single frame per connection, then close it or
+        # stop answering. A connection that goes quiet after a reply is not
+        # a failed attempt: the frame is sent again on a new connection, and
+        # the following ones get a connection each. Only a frame that gets
+        # no reply on a new connection uses up an attempt.
+        #
+        # maxAttempts defaults to MAX_ATTEMPTS and timeout, the wait for each
+        # reply, to SOCKET_TIMEOUT_S. Returns the replies in order,
+        # None for the frames still unanswered once the attempts are used up,
+        # or None if cancelled.
+        if pendingRequests is None:
+            pendingRequests = PendingRequests()
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        # Replies are received in place, frames are parsed from slices of it
+        receiveBuffer = bytearray(1024)
+        receiveView = memoryview(receiveBuffer)
+
+        responses = [None] * len(messages)
+        position = 0
         attempt = 1
-        MAX_ATTEMPTS = 5
-        while attempt <= MAX_ATTEMPTS:
-            if attempt > 1:
-                _LOGGER.debug(f"Attempt {attempt} of {MAX_ATTEMPTS}...")
+        if maxAttempts is None:
+            maxAttempts = Communication.MAX_ATTEMPTS
+        if timeout is None:
+            timeout = Communication.SOCKET_TIMEOUT_S
+        sock = None
+        buffer = bytearray()
+        # Replies received on the current connection
+        answered = 0
+        reuseConnection = True
+        try:
+            while position < len(messages):
+                if cancelEvent is not None and cancelEvent.is_set():
+                    _LOGGER.debug("Request cancelled, giving up")
+                    return None
 
-            try:
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                    sock.connect((ip, port))
-                    _LOGGER.debug(f"Sending: {message.getRawDataBytes().decode('ascii')}")
-                    sock.sendall(message.getRawDataBytes() + b"\n")
-                    received = sock.recv(1024).decode("ascii").strip()
-                    _LOGGER.debug(f"Received: {received}")
-                    return received
-
-            except socket.error as e:
-                attempt += 1
-                _LOGGER.debug(f"Socket error: {str(e)}")
-                time.sleep(1)
-
-        _LOGGER.error("Connection failed, no more attempts left")
-        return None
+                if rateLimiter is not None:
+                    # Every frame sent counts, resent ones included
+                    if not rateLimiter.acquire(1, cancelEvent):
+                        _LOGGER.debug("Request cancelled while rate limited, giving up")
+                        return None
+
+                messageId = pendingRequests.register(position)
+                frame = Message.replaceMessageId(messages[position].rawData, messageId)
+                sentAt = time.monotonic()
+                try:
+                    if sock is None:
+                        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                        sock.settimeout(Communication.SOCKET_TIMEOUT_S)
+                        sock.connect((ip, port))
+                        buffer.clear()
+                        answered = 0
+                    if debug:
+                        _LOGGER.debug(f"Sending: {frame.decode('ascii')}")
+                    if frameTrace is not None:
+                        frameTrace.sent(frame, attempt)
+                    sock.sendall(frame + b"\n")
+
+                    deadline = time.monotonic() + timeout
+                    while responses[position] is None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise socket.timeout("timed out")
+                        if cancelEvent is not None:
+                            if cancelEvent.is_set():
+                                _LOGGER.debug("Request cancelled, giving up")
+                                pendingRequests.expire(messageId)
+                                return None
+                            remaining = min(remaining, Communication.CANCEL_CHECK_S)
+                        sock.settimeout(remaining)
+                        try:
+                            received = sock.recv_into(receiveBuffer)
+                        except socket.timeout:
+                            continue
+                        if not received:
+                            raise socket.error("Connection closed before the reply")
+                        buffer += receiveView[:received]
+                        replies, rest = Message.splitFrames(buffer)
+                        buffer[:] = rest
+                        for reply in replies:
+                            if frameTrace is not None:
+                                frameTrace.received(reply, attempt, time.monotonic() - sentAt)
+                            if debug:
+                                _LOGGER.debug(f"Received: {reply.decode('ascii', 'replace')}")
+                            replyId = Message.frameMessageId(reply)
+                            found, _ = pendingRequests.resolve(replyId)
+                            if found and replyId == messageId:
+                                responses[position] = reply
+                            elif debug:
+                                _LOGGER.debug(f"Dropping reply with unexpected ID: {replyId}")
+
+                    position += 1
+                    answered += 1
+                    if not reuseConnection:
+                        sock.close()
+                        sock = None
+
+                except (socket.error, UnicodeDecodeError) as e:
+                    pendingRequests.expire(messageId)
+                    if frameTrace is not None:
+                        frameTrace.failed(str(e), attempt, time.monotonic() - sentAt)
+                    if sock is not None:
+                        sock.close()
+                        sock = None
+                    if answered:
+                        _LOGGER.debug(
+                            f"Connection dropped after {answered} replies, reconnecting: {str(e)}"
+                        )
+                        reuseConnection = False
+                        continue
+
+                    _LOGGER.debug(f"Socket error: {str(e)}")
+                    if attempt >= maxAttempts:
+                        break
+                    attempt += 1
+                    _LOGGER.debug(f"Attempt {attempt} of {maxAttempts}...")
+                    if cancelEvent is not None:
+                        # Wakes up early if the request gets cancelled
+                        cancelEvent.wait(1)
+                    else:
+                        time.sleep(1)
+        finally:
+            if sock is not None:
+                sock.close()
+
+        if position < len(messages):
+            _LOGGER.error(
+                f"Connection failed, no more attempts left ({position} of {len(messages)} answered)"
+            )
+        return responses
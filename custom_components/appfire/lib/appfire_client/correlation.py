@@ -0,0 +1,72 @@
+import collections
+import random
+import threading
+
+_MISSING = object()
+
+
+class MessageIdAllocator:
+    # Monotonic 6-digit message IDs. Starts at a random point so IDs do not
+    # repeat right after a restart, wraps around after 999999.
+
+    ID_MODULO = 1000000
+
+    def __init__(self, start: int = None):
+        self._next = random.randrange(self.ID_MODULO) if start is None else start
+        self._lock = threading.Lock()
+
+    def next(self) -> str:
+        with self._lock:
+            messageId = self._next
+            self._next = (self._next + 1) % self.ID_MODULO
+        return str(messageId).zfill(6)
+
+
+class PendingRequests:
+    # Table of the requests waiting for a reply on one stove connection,
+    # keyed by message ID. Replies are routed to their waiter; replies to
+    # requests given up on (stale) or never sent (unknown) are dropped.
+
+    RECENTLY_EXPIRED_SIZE = 64
+
+    def __init__(self, allocator: MessageIdAllocator = None):
+        self.allocator = allocator if allocator is not None else MessageIdAllocator()
+        self._waiters = {}
+        self._expired = collections.deque(maxlen=self.RECENTLY_EXPIRED_SIZE)
+        self._lock = threading.Lock()
+
+        self.matchedReplies = 0
+        self.staleReplies = 0
+        self.unknownReplies = 0
+
+    def register(self, waiter=None) -> str:
+        messageId = self.allocator.next()
+        with self._lock:
+            self._waiters[messageId] = waiter
+        return messageId
+
+    def expire(self, messageId: str):
+        with self._lock:
+            if self._waiters.pop(messageId, _MISSING) is not _MISSING:
+                self._expired.append(messageId)
+
+    def resolve(self, messageId: str):
+        # Returns (True, waiter) if the ID is the one of a pending request
+        with self._lock:
+            if messageId in self._waiters:
+                self.matchedReplies += 1
+                return True, self._waiters.pop(messageId)
+            if messageId in self._expired:
+                self.staleReplies += 1
+            else:
+                self.unknownReplies += 1
+        return False, None
+
+    def getStats(self) -> dict:
+        with self._lock:
+            return {
+                "pending": len(self._waiters),
+                "matched_replies": self.matchedReplies,
+                "stale_replies": self.staleReplies,
+                "unknown_replies": self.unknownReplies,
+            }
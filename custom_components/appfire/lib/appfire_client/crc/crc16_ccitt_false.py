@@ -1,17 +1,30 @@
+def _buildTable() -> list[int]:
+    poly = 0x1021
+    table = []
+    for byte in range(256):
+        crc = byte << 8
+        for j in range(0, 8):
+            if (crc & 0x8000) > 0:
+                crc = (crc << 1) ^ poly
+            else:
+                crc = crc << 1
+        table.append(crc & 0xFFFF)
+    return table
+
+
+_TABLE = _buildTable()
+
+
 class Crc16_ccitt_false:
     @staticmethod
     def crc_from(data: bytes) -> hex:
         # https://gist.github.com/tijnkooijmans/10981093?permalink_comment_id=2898199#gistcomment-2898199
+        # Table-driven, works on bytes, bytearray and memoryview slices
 
-        poly = 0x1021
         crc = 0xFFFF
+        table = _TABLE
 
-        for i in range(0, len(data)):
-            crc ^= data[i] << 8
-            for j in range(0, 8):
-                if (crc & 0x8000) > 0:
-                    crc = (crc << 1) ^ poly
-                else:
-                    crc = crc << 1
+        for byte in data:
+            crc = ((crc << 8) & 0xFFFF) ^ table[(crc >> 8) ^ byte]
 
-        return crc & 0xFFFF
+        return crc
@@ -0,0 +1,34 @@
+# Weekly on/off schedule of the stove ("crono" in the vendor app).
+#
+# The layout below is provisional, inferred from the vendor app and not
+# yet confirmed on every stove model: page 3 of DAT holds, for each day
+# from Monday to Sunday, SLOTS_PER_DAY slots as start;stop pairs in
+# minutes since midnight. A slot whose start equals its stop is unused,
+# a stop before the start ends on the next day.
+
+CRONO_PAGE = 3
+DAYS = 7
+SLOTS_PER_DAY = 3
+VALUES_PER_SLOT = 2
+CRONO_SCHEDULE_LENGTH = DAYS * SLOTS_PER_DAY * VALUES_PER_SLOT
+
+MINUTES_PER_DAY = 24 * 60
+
+
+def decodeCronoSchedule(values: list[str]) -> list[dict]:
+    # Returns the used slots as {"day", "start", "stop"}, day 0 is Monday
+    slots = []
+    for position in range(0, CRONO_SCHEDULE_LENGTH, VALUES_PER_SLOT):
+        start, stop = int(values[position]), int(values[position + 1])
+        if not (0 <= start < MINUTES_PER_DAY and 0 <= stop < MINUTES_PER_DAY):
+            raise ValueError(f"Invalid crono slot: {start};{stop}")
+        if start == stop:
+            continue
+        slots.append(
+            {
+                "day": position // (SLOTS_PER_DAY * VALUES_PER_SLOT),
+                "start": start,
+                "stop": stop,
+            }
+        )
+    return slots
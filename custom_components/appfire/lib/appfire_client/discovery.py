@@ -0,0 +1,39 @@
+import asyncio
+import logging
+
+from .async_communication import AsyncCommunication
+from .message import ChecksumError
+from .message_data_page_read_request import MessageDataPageReadRequest
+from .message_data_page_read_response import MessageDataPageReadResponse
+
+_LOGGER = logging.getLogger(__name__)
+
+SCAN_TIMEOUT_S = 2
+SCAN_CONCURRENCY = 32
+
+
+async def scanHosts(
+    hosts: list[str],
+    port: int,
+    concurrency: int = SCAN_CONCURRENCY,
+    timeout: float = SCAN_TIMEOUT_S,
+) -> dict[str, dict]:
+    # Returns the decoded DAT 0 page of every host that answers like a stove.
+    # The protocol carries no serial number, callers tell stoves apart.
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def probe(ip: str) -> dict:
+        async with semaphore:
+            response = await AsyncCommunication.sendMessage(
+                ip, port, MessageDataPageReadRequest(0), maxAttempts=1, timeout=timeout
+            )
+        if response is None:
+            return None
+        try:
+            return MessageDataPageReadResponse(response, 0).decode()
+        except (ChecksumError, ValueError) as e:
+            _LOGGER.debug(f"{ip}:{port} is not a stove: {str(e)}")
+            return None
+
+    results = await asyncio.gather(*(probe(ip) for ip in hosts))
+    return {ip: data for ip, data in zip(hosts, results) if data is not None}
@@ -0,0 +1,216 @@
+"""Headless fleet poller.
+
+Polls many stoves without Home Assistant and streams the decoded DAT 0
+records as JSON lines, one per poll, to stdout or to the clients of a
+local Unix socket. Stoves are sharded across worker processes, each one
+running an asyncio poll loop.
+
+Usage, from custom_components/appfire/lib:
+
+    python -m appfire_client.fleet fleet.json [--workers N] [--interval S]
+                                              [--socket PATH]
+
+fleet.json is a list of {"serial": ..., "ip": ..., "port": 5001}.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import signal
+import sys
+import threading
+import time
+
+from .async_communication import AsyncCommunication
+from .correlation import PendingRequests
+from .message import ChecksumError
+from .message_data_page_read_request import MessageDataPageReadRequest
+from .message_data_page_read_response import MessageDataPageReadResponse
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_PORT = 5001
+DEFAULT_INTERVAL_S = 60
+# Connections open at the same time in one worker
+MAX_CONNECTIONS_PER_WORKER = 64
+# How often the parent looks for dead workers to restart
+WORKER_CHECK_INTERVAL_S = 5
+# Socket clients with more unsent data than this are disconnected
+MAX_CLIENT_BUFFER_BYTES = 1024 * 1024
+
+
+def loadFleet(path: str) -> list[dict]:
+    with open(path, encoding="utf-8") as fleetFile:
+        fleet = json.load(fleetFile)
+    for stove in fleet:
+        stove.setdefault("port", DEFAULT_PORT)
+    return fleet
+
+
+async def pollStove(stove: dict, interval: float, startDelay: float, limiter, output):
+    pendingRequests = PendingRequests()
+    await asyncio.sleep(startDelay)
+    while True:
+        started = time.monotonic()
+        record = {"serial": stove.get("serial"), "ip": stove["ip"], "ts": time.time()}
+        try:
+            async with limiter:
+                response = await AsyncCommunication.sendMessage(
+                    stove["ip"], stove["port"], MessageDataPageReadRequest(0), pendingRequests
+                )
+            if response is None:
+                record["error"] = "no response"
+            else:
+                record["data"] = MessageDataPageReadResponse(response, 0).decode()
+        except (ChecksumError, ValueError) as e:
+            record["error"] = str(e)
+        except Exception as e:
+            # Whatever goes wrong with one stove must not stop the others
+            _LOGGER.exception(f"Unexpected error polling {stove['ip']}")
+            record["error"] = f"{type(e).__name__}: {e}"
+        record["latency_s"] = round(time.monotonic() - started, 3)
+        output.put(json.dumps(record, separators=(",", ":")) + "\n")
+
+        await asyncio.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+
+async def runWorker(stoves: list[dict], interval: float, output):
+    limiter = asyncio.Semaphore(MAX_CONNECTIONS_PER_WORKER)
+    # Spread the polls over the interval instead of firing them all at once
+    results = await asyncio.gather(
+        *(
+            pollStove(stove, interval, interval * index / len(stoves), limiter, output)
+            for index, stove in enumerate(stoves)
+        ),
+        return_exceptions=True,
+    )
+    for stove, result in zip(stoves, results):
+        if isinstance(result, BaseException):
+            _LOGGER.error(f"Stopped polling {stove['ip']}: {result!r}")
+
+
+def workerMain(stoves: list[dict], interval: float, output):
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    asyncio.run(runWorker(stoves, interval, output))
+
+
+class SocketBroadcaster:
+    # Sends every record to all the clients connected to a Unix socket
+
+    def __init__(self, path: str):
+        self.path = path
+        self._clients = set()
+
+    async def start(self):
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        await asyncio.start_unix_server(self._handleClient, self.path)
+
+    async def _handleClient(self, reader, writer):
+        self._clients.add(writer)
+        try:
+            await reader.read()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._clients.discard(writer)
+            writer.close()
+
+    def send(self, line: str):
+        data = line.encode("utf-8")
+        for writer in list(self._clients):
+            if writer.is_closing():
+                self._clients.discard(writer)
+            elif writer.transport.get_write_buffer_size() > MAX_CLIENT_BUFFER_BYTES:
+                # Not reading fast enough, its backlog would grow without bound
+                _LOGGER.warning("Disconnecting a socket client that fell behind")
+                self._clients.discard(writer)
+                writer.close()
+            else:
+                writer.write(data)
+
+
+def startWorker(stoves: list[dict], interval: float, output) -> multiprocessing.Process:
+    worker = multiprocessing.Process(
+        target=workerMain, args=(stoves, interval, output), daemon=True
+    )
+    worker.start()
+    return worker
+
+
+async def superviseWorkers(workers: list, shards: list[list[dict]], interval: float, output):
+    # Restarts the workers that died, with the same shard of stoves
+    while True:
+        await asyncio.sleep(WORKER_CHECK_INTERVAL_S)
+        for index, worker in enumerate(workers):
+            if not worker.is_alive():
+                _LOGGER.error(
+                    f"Worker {index} exited with code {worker.exitcode}, restarting it"
+                )
+                workers[index] = startWorker(shards[index], interval, output)
+
+
+async def forwardRecords(output, socketPath: str):
+    loop = asyncio.get_running_loop()
+    broadcaster = None
+    if socketPath is not None:
+        broadcaster = SocketBroadcaster(socketPath)
+        await broadcaster.start()
+
+    lines = asyncio.Queue()
+
+    def readOutput():
+        while True:
+            try:
+                line = output.get()
+            except (EOFError, OSError):
+                return
+            loop.call_soon_threadsafe(lines.put_nowait, line)
+
+    threading.Thread(target=readOutput, daemon=True).start()
+
+    while True:
+        line = await lines.get()
+        if broadcaster is not None:
+            broadcaster.send(line)
+        else:
+            sys.stdout.write(line)
+            sys.stdout.flush()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Poll a fleet of AppFire stoves.")
+    parser.add_argument("fleet", help="JSON file listing the stoves")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL_S)
+    parser.add_argument("--socket", help="Unix socket to stream records to instead of stdout")
+    args = parser.parse_args(argv)
+
+    fleet = loadFleet(args.fleet)
+    workerCount = max(1, min(args.workers, len(fleet)))
+    output = multiprocessing.Queue()
+
+    shards = [fleet[shard::workerCount] for shard in range(workerCount)]
+    workers = [startWorker(stoves, args.interval, output) for stoves in shards]
+
+    async def runParent():
+        await asyncio.gather(
+            forwardRecords(output, args.socket),
+            superviseWorkers(workers, shards, args.interval, output),
+        )
+
+    # Stop the workers on SIGTERM as well
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        asyncio.run(runParent())
+    except (KeyboardInterrupt, SystemExit):
+        pass
+    finally:
+        for worker in workers:
+            worker.terminate()
+
+
+if __name__ == "__main__":
+    main()
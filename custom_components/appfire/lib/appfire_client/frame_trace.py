@@ -0,0 +1,46 @@
+import collections
+import time
+
+from .message import ChecksumError, Message
+
+
+class FrameTrace:
+    # Last frames exchanged with one stove, for diagnostics. Recording only
+    # appends a tuple to a bounded deque, anything else (checksum check,
+    # decoding) is done when the entries are read.
+
+    DEFAULT_SIZE = 50
+
+    def __init__(self, size: int = DEFAULT_SIZE):
+        self._entries = collections.deque(maxlen=size)
+
+    def sent(self, frame: bytes, attempt: int):
+        self._entries.append((time.time(), "sent", frame, attempt, None))
+
+    def received(self, frame: bytes, attempt: int, elapsed: float):
+        self._entries.append((time.time(), "received", frame, attempt, elapsed))
+
+    def failed(self, error: str, attempt: int, elapsed: float):
+        self._entries.append((time.time(), "error", error, attempt, elapsed))
+
+    def getEntries(self) -> list[dict]:
+        entries = []
+        for timestamp, kind, frame, attempt, elapsed in list(self._entries):
+            entry = {"ts": round(timestamp, 3), "kind": kind, "attempt": attempt}
+            if elapsed is not None:
+                entry["elapsed_ms"] = round(elapsed * 1000, 1)
+            if kind == "error":
+                entry["error"] = frame
+            else:
+                entry["frame"] = frame.decode("ascii", "replace")
+                entry["crc_valid"] = FrameTrace._isCrcValid(frame)
+            entries.append(entry)
+        return entries
+
+    @staticmethod
+    def _isCrcValid(frame: bytes) -> bool:
+        try:
+            Message(frame)
+        except (ChecksumError, ValueError):
+            return False
+        return True
@@ -1,39 +1,83 @@
-import random
-
+from .correlation import MessageIdAllocator
 from .crc.crc16_ccitt_false import Crc16_ccitt_false
 
+# Used when the sender does not stamp frames with its own IDs
+_MESSAGE_ID_ALLOCATOR = MessageIdAllocator()
+
+# Frame layout: '#' + ID (6) + '---' + payload length (4, hex) + payload
+# type (3) + operation type (1) + payload + CRC (4, hex). Frames are kept
+# as bytes, header fields and CRC are read straight from slices of them.
+HEADER_LENGTH = 18
+CRC_LENGTH = 4
+
 
 class Message:
     def __init__(self, rawData):
+        if isinstance(rawData, str):
+            rawData = bytes(rawData, "ascii")
+        elif rawData is not None and not isinstance(rawData, bytes):
+            rawData = bytes(rawData)
         self.rawData = rawData
+        self._payload = None
         if not self.isCrcValid():
             raise ChecksumError("Checksum is not valid")
 
     @staticmethod
-    def buildRawData(payloadType, operationType, payloadList):
-        payload = ";".join(payloadList) + ";"
-
-        rawData = Message._generateRandomMessageId()
-        rawData += "---"
-        rawData += str(format(len(payload), "04x"))
-        rawData += payloadType
-        rawData += operationType
+    def buildRawData(payloadType, operationType, payloadList) -> bytes:
+        payload = bytes(";".join(payloadList) + ";", "ascii")
+
+        rawData = bytearray(b"#")
+        rawData += bytes(Message._generateMessageId(), "ascii")
+        rawData += b"---"
+        rawData += b"%04x" % len(payload)
+        rawData += bytes(payloadType, "ascii")
+        rawData += bytes(operationType, "ascii")
         rawData += payload
+        rawData += b"%04X" % Crc16_ccitt_false.crc_from(memoryview(rawData)[1:])
 
-        checksum = format(
-            Crc16_ccitt_false.crc_from(bytes(rawData, "ascii")), "04x"
-        ).upper()
+        return bytes(rawData)
 
-        # Prepend the '#' character
-        rawData = "#" + rawData + checksum
+    @staticmethod
+    def splitFrames(data: bytes):
+        # Returns the complete frames found in data and the incomplete rest
+        frames = []
+        start = data.find(b"#")
+        while start != -1:
+            if len(data) < start + HEADER_LENGTH:
+                break
+            try:
+                payloadLength = int(data[start + 10 : start + 14], 16)
+            except ValueError:
+                start = data.find(b"#", start + 1)
+                continue
+            end = start + HEADER_LENGTH + payloadLength + CRC_LENGTH
+            if len(data) < end:
+                break
+            frames.append(bytes(data[start:end]))
+            start = data.find(b"#", end)
+
+        rest = bytes(data[start:]) if start != -1 else b""
+        return frames, rest
 
-        return rawData
+    @staticmethod
+    def frameMessageId(rawData: bytes) -> str:
+        return rawData[1:7].decode("ascii")
+
+    @staticmethod
+    def replaceMessageId(rawData: bytes, messageId: str) -> bytes:
+        # Same frame with another message ID, the checksum covers the ID
+        payloadLength = int(rawData[10:14], 16)
+        end = HEADER_LENGTH + payloadLength
+        frame = bytearray(rawData[: end + CRC_LENGTH])
+        frame[1:7] = bytes(messageId, "ascii")
+        frame[end:] = b"%04X" % Crc16_ccitt_false.crc_from(memoryview(frame)[1:end])
+        return bytes(frame)
 
     def getMessageId(self):
         if self.rawData is None:
             return None
         else:
-            return self.rawData[1:7]
+            return Message.frameMessageId(self.rawData)
 
     def getPayloadLength(self) -> int:
         if self.rawData is None:
@@ -45,37 +89,36 @@ class Message:
         if self.rawData is None:
             return None
         else:
-            return self.rawData[14:17]
+            return self.rawData[14:17].decode("ascii")
 
     def getOperationType(self):
         if self.rawData is None:
             return None
         else:
-            return self.rawData[17:18]
+            return self.rawData[17:18].decode("ascii")
 
     def getPayload(self):
         if self.rawData is None:
             return None
-        else:
-            return self._getRawPayload().split(";")
+        elif self._payload is None:
+            # Decoded once, every getter of the responses reads from it
+            self._payload = self._getRawPayload().decode("ascii").split(";")
+        return self._payload
 
     def getCrc(self):
         if self.rawData is None:
             return None
         else:
-            return int(self.rawData[18 + self.getPayloadLength() :], 16)
+            return int(self.rawData[HEADER_LENGTH + self.getPayloadLength() :], 16)
 
     def isCrcValid(self):
         if self.rawData is None:
-            return false
+            return False
         else:
             return self._calculateCrc() == self.getCrc()
 
     def getRawDataBytes(self):
-        if self.rawData is None:
-            return None
-        else:
-            return bytes(self.rawData, "ascii")
+        return self.rawData
 
     # private methods
 
@@ -83,18 +126,18 @@ class Message:
         if self.rawData is None:
             return None
         else:
-            return self.rawData[18 : 18 + self.getPayloadLength()]
+            return self.rawData[HEADER_LENGTH : HEADER_LENGTH + self.getPayloadLength()]
 
     def _calculateCrc(self):
         if self.rawData is None:
             return None
         else:
-            data = self.rawData[1 : 18 + self.getPayloadLength()]
-            return Crc16_ccitt_false.crc_from(bytes(data, "ascii"))
+            end = HEADER_LENGTH + self.getPayloadLength()
+            return Crc16_ccitt_false.crc_from(memoryview(self.rawData)[1:end])
 
     @staticmethod
-    def _generateRandomMessageId():
-        return str(random.randint(0, 999999)).zfill(6)
+    def _generateMessageId():
+        return _MESSAGE_ID_ALLOCATOR.next()
 
 
 class ChecksumError(Exception):
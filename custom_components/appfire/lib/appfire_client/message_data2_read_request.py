@@ -1,8 +1,8 @@
 from enum import IntEnum
 
-from .message import Message
+from .message_data_page_read_request import MessageDataPageReadRequest
 
-class MessageData2ReadRequest(Message):
+class MessageData2ReadRequest(MessageDataPageReadRequest):
 
     def __init__(self):
-        super().__init__(Message.buildRawData("DAT", "R", ["2"]))
+        super().__init__(2)
@@ -0,0 +1,6 @@
+from .message import Message
+
+
+class MessageDataPageReadRequest(Message):
+    def __init__(self, page: int):
+        super().__init__(Message.buildRawData("DAT", "R", [str(page)]))
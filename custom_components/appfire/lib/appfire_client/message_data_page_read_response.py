@@ -0,0 +1,35 @@
+from .message import Message
+from .page_registry import PAGE_LAYOUTS, Block
+
+
+class MessageDataPageReadResponse(Message):
+    def __init__(self, rawData, page: int):
+        super().__init__(rawData)
+        self.page = page
+
+    def getRawValue(self, index: int) -> str:
+        payload = self.getPayload()
+        if payload is None or index >= len(payload):
+            return None
+        else:
+            return payload[index]
+
+    def decode(self) -> dict:
+        # Decodes every field mapped for this page, missing ones are None
+        payload = self.getPayload()
+        if payload is None:
+            return None
+
+        values = {}
+        for field in PAGE_LAYOUTS.get(self.page, []):
+            if isinstance(field, Block):
+                end = field.index + field.length
+                if end <= len(payload) and "" not in payload[field.index:end]:
+                    values[field.name] = field.decode(payload[field.index:end])
+                else:
+                    values[field.name] = None
+            elif field.index < len(payload) and payload[field.index] != "":
+                values[field.name] = field.decode(payload[field.index])
+            else:
+                values[field.name] = None
+        return values
@@ -11,10 +11,31 @@ class MessageDataWriteRequest(Message):
     def __init__(self, rawData):
         super().__init__(rawData)
 
+    @staticmethod
+    def encodePowerStatus(statusOn: bool) -> tuple[int, int]:
+        return (Index.POWER_STATUS_INDEX, 1 if statusOn else 0)
+
+    @staticmethod
+    def encodeDesiredAmbientTemperature(temperature: float) -> tuple[int, int]:
+        return (Index.TEMPERATURE_INDEX, int(temperature * 10))
+
+    @staticmethod
+    def buildRawDataSetRegisters(registers: list[tuple[int, int]]):
+        # One frame carrying several (index, value) pairs
+        payloadList = []
+        for index, value in registers:
+            payloadList.append(str(int(index)))
+            payloadList.append(str(int(value)))
+        return Message.buildRawData("DAT", "W", payloadList)
+
     @staticmethod
     def buildRawDataSetPowerStatus(statusOn: bool):
-        return Message.buildRawData("DAT", "W", [str(Index.POWER_STATUS_INDEX), "1" if statusOn else "0"])
+        return MessageDataWriteRequest.buildRawDataSetRegisters(
+            [MessageDataWriteRequest.encodePowerStatus(statusOn)]
+        )
 
     @staticmethod
     def buildRawDataSetDesiredAmbientTemperature(temperature: float):
-        return Message.buildRawData("DAT", "W", [str(Index.TEMPERATURE_INDEX), str(int(temperature * 10))])
+        return MessageDataWriteRequest.buildRawDataSetRegisters(
+            [MessageDataWriteRequest.encodeDesiredAmbientTemperature(temperature)]
+        )
@@ -15,3 +15,11 @@ class MessageDataWriteResponse(Message):
             return False
         else:
             return payload[0] == "OK"
+
+    def getRegisterResults(self) -> list[bool]:
+        # One result per register written, in request order
+        payload = self.getPayload()
+        if payload is None:
+            return []
+        else:
+            return [result == "OK" for result in payload if result != ""]
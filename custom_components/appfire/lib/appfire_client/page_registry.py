@@ -0,0 +1,61 @@
+from .crono import CRONO_PAGE, CRONO_SCHEDULE_LENGTH, decodeCronoSchedule
+from .message_data_read_response import Index as DataIndex
+from .message_data2_read_response import Index as Data2Index
+
+
+def _flag(raw: str) -> bool:
+    return int(raw) == 1
+
+
+def _tenths(raw: str) -> float:
+    return int(raw) / 10
+
+
+class Field:
+    def __init__(self, name: str, index: int, decode=int):
+        self.name = name
+        self.index = int(index)
+        self.decode = decode
+
+
+class Block(Field):
+    # Several consecutive values decoded together, decode takes the list
+    def __init__(self, name: str, index: int, length: int, decode):
+        super().__init__(name, index, decode)
+        self.length = length
+
+
+# Field layout of each DAT page, by page number.
+# Mapping a new page here is enough to read and decode it with readPage.
+PAGE_LAYOUTS: dict[int, list[Field]] = {
+    0: [
+        Field("status", DataIndex.STATUS_INDEX),
+        Field("power_status", DataIndex.POWER_INDEX, _flag),
+        Field("eco_mode", DataIndex.ECO_MODE_INDEX, _flag),
+        Field("crono_mode", DataIndex.CRONO_MODE_INDEX),
+        Field("ambient_temperature", DataIndex.AMBIENT_TEMPERATURE_INDEX, _tenths),
+        Field("desired_ambient_temperature", DataIndex.DESIRED_AMBIENT_TEMPERATURE_INDEX, _tenths),
+        Field("desired_ambient_temperature_min", DataIndex.DESIRED_AMBIENT_TEMPERATURE_MIN_INDEX, _tenths),
+        Field("desired_ambient_temperature_max", DataIndex.DESIRED_AMBIENT_TEMPERATURE_MAX_INDEX, _tenths),
+        Field("smoke_temperature", DataIndex.SMOKE_TEMPERATURE_INDEX, _tenths),
+        Field("power_percentage", DataIndex.POWER_PERCENTAGE_INDEX),
+        Field("desired_max_power_percentage", DataIndex.DESIRED_MAX_POWER_PERCENTAGE_INDEX),
+        Field("desired_max_power_percentage_min", DataIndex.DESIRED_MAX_POWER_LEVEL_MIN_INDEX),
+        Field("desired_max_power_percentage_max", DataIndex.DESIRED_MAX_POWER_LEVEL_MAX_INDEX),
+        Field("smoke_fan_rpm", DataIndex.SMOKE_FAN_RPM_INDEX),
+    ],
+    2: [
+        Field("fan1_percentage", Data2Index.FAN1_PERCENTAGE_INDEX),
+    ],
+    CRONO_PAGE: [
+        Block("crono_schedule", 0, CRONO_SCHEDULE_LENGTH, decodeCronoSchedule),
+    ],
+}
+
+
+def getPageOfField() -> dict[str, int]:
+    return {
+        field.name: page
+        for page, fields in PAGE_LAYOUTS.items()
+        for field in fields
+    }
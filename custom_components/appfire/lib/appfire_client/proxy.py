@@ -0,0 +1,243 @@
+import asyncio
+import logging
+import time
+
+from .correlation import PendingRequests
+from .message import ChecksumError, Message
+from .rate_limiter import TokenBucket
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AppFireProxy:
+    # Shares one stove connection between many clients (Home Assistant,
+    # the vendor app, ...). Requests are forwarded one at a time with a
+    # proxy-owned message ID and replies are sent back with the client's
+    # ID. Identical reads are answered from a short-lived cache and reads
+    # already in flight are shared. Writes still queued when their client
+    # disconnects (e.g. after timing out, to send them again) are dropped,
+    # so a write reaches the stove once however often it is resent.
+
+    UPSTREAM_TIMEOUT_S = 5
+    MAX_ATTEMPTS = 3
+
+    def __init__(
+        self,
+        stoveIp,
+        stovePort,
+        host="0.0.0.0",
+        port=5001,
+        cacheTtl=2.0,
+        rateLimiter: TokenBucket = None,
+    ):
+        self.stoveIp = stoveIp
+        self.stovePort = stovePort
+        self.host = host
+        self.port = port
+        self.cacheTtl = cacheTtl
+        self.rateLimiter = rateLimiter
+
+        self._server = None
+        self._upstreamReader = None
+        self._upstreamWriter = None
+        self._upstreamBuffer = b""
+        self._upstreamLock = asyncio.Lock()
+        self._pendingRequests = PendingRequests()
+        self._cache = {}
+        self._inFlight = {}
+        self._clients = set()
+
+        self.stats = {
+            "requests": 0,
+            "cache_hits": 0,
+            "shared_reads": 0,
+            "upstream_exchanges": 0,
+            "upstream_failures": 0,
+            "dropped_writes": 0,
+            "invalid_frames": 0,
+        }
+
+    async def start(self):
+        self._server = await asyncio.start_server(
+            self._handleClient, self.host, self.port
+        )
+        _LOGGER.debug(f"Proxy for {self.stoveIp}:{self.stovePort} listening on {self.host}:{self.port}")
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for writer in list(self._clients):
+            writer.close()
+        self._closeUpstream()
+
+    def setStoveAddress(self, stoveIp):
+        # The next exchange connects to the new address
+        self.stoveIp = stoveIp
+        self._cache.clear()
+        self._closeUpstream()
+
+    async def forward(self, frame: bytes, useCache: bool = True) -> bytes:
+        # Handles a request from the process running the proxy. A read with
+        # useCache=False always gets a reply read from the stove after the
+        # call, e.g. for a stream of samples faster than the cache TTL.
+        return await self._handleRequest(frame, useCache)
+
+    def getClientTimeout(self) -> float:
+        # Longest a local client may wait for a reply: its own exchange,
+        # rate limit waits and upstream attempts included, after one more
+        # exchange queued ahead of it
+        tokenWait = 1 / self.rateLimiter.rate if self.rateLimiter is not None else 0
+        exchange = self.MAX_ATTEMPTS * (tokenWait + 2 * self.UPSTREAM_TIMEOUT_S)
+        return 2 * exchange
+
+    def getStats(self) -> dict:
+        return {
+            **self.stats,
+            **self._pendingRequests.getStats(),
+            "clients": len(self._clients),
+        }
+
+    # private methods
+
+    async def _handleClient(self, reader, writer):
+        self._clients.add(writer)
+        buffer = b""
+        try:
+            while True:
+                data = await reader.read(1024)
+                if not data:
+                    break
+                frames, buffer = Message.splitFrames(buffer + data)
+                for frame in frames:
+                    reply = await self._handleRequest(
+                        frame, clientGone=lambda: reader.at_eof() or writer.is_closing()
+                    )
+                    if reply is not None:
+                        writer.write(reply + b"\n")
+                        await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError) as e:
+            _LOGGER.debug(f"Client error: {str(e)}")
+        finally:
+            self._clients.discard(writer)
+            writer.close()
+
+    async def _handleRequest(
+        self, frame: bytes, useCache: bool = True, clientGone=None
+    ) -> bytes:
+        try:
+            request = Message(frame)
+        except (ChecksumError, ValueError):
+            self.stats["invalid_frames"] += 1
+            return None
+
+        self.stats["requests"] += 1
+        clientId = request.getMessageId()
+        # Everything but the message ID and the checksum
+        requestKey = frame[7 : 18 + request.getPayloadLength()]
+
+        if request.getOperationType() != "R":
+            # Writes change what reads return
+            self._cache.clear()
+            reply = await self._exchange(frame, clientGone)
+            return None if reply is None else Message.replaceMessageId(reply, clientId)
+
+        cached = self._cache.get(requestKey)
+        if useCache and cached is not None and time.monotonic() - cached[0] < self.cacheTtl:
+            self.stats["cache_hits"] += 1
+            return Message.replaceMessageId(cached[1], clientId)
+
+        inFlight = self._inFlight.get(requestKey)
+        if not useCache:
+            # A read in flight may have been sent before the call
+            reply = await self._exchange(frame)
+            if reply is not None:
+                self._cache[requestKey] = (time.monotonic(), reply)
+        elif inFlight is not None:
+            self.stats["shared_reads"] += 1
+            reply = await asyncio.shield(inFlight)
+        else:
+            inFlight = asyncio.get_running_loop().create_future()
+            self._inFlight[requestKey] = inFlight
+            reply = None
+            try:
+                reply = await self._exchange(frame)
+            finally:
+                del self._inFlight[requestKey]
+                inFlight.set_result(reply)
+            if reply is not None:
+                self._cache[requestKey] = (time.monotonic(), reply)
+
+        return None if reply is None else Message.replaceMessageId(reply, clientId)
+
+    async def _exchange(self, frame: bytes, clientGone=None) -> bytes:
+        # clientGone tells whether the client of the request disconnected,
+        # which is checked right before every upstream send
+        async with self._upstreamLock:
+            for attempt in range(1, self.MAX_ATTEMPTS + 1):
+                if self.rateLimiter is not None:
+                    wait = self.rateLimiter.reserve()
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+
+                if clientGone is not None and clientGone():
+                    _LOGGER.debug("Client disconnected, dropping its request")
+                    self.stats["dropped_writes"] += 1
+                    if self.rateLimiter is not None:
+                        self.rateLimiter.release()
+                    return None
+
+                upstreamId = self._pendingRequests.register()
+                upstreamFrame = Message.replaceMessageId(frame, upstreamId)
+                try:
+                    if self._upstreamWriter is None:
+                        (
+                            self._upstreamReader,
+                            self._upstreamWriter,
+                        ) = await asyncio.wait_for(
+                            asyncio.open_connection(self.stoveIp, self.stovePort),
+                            self.UPSTREAM_TIMEOUT_S,
+                        )
+                        self._upstreamBuffer = b""
+
+                    self.stats["upstream_exchanges"] += 1
+                    self._upstreamWriter.write(upstreamFrame + b"\n")
+                    await self._upstreamWriter.drain()
+                    return await asyncio.wait_for(
+                        self._readReply(upstreamId), self.UPSTREAM_TIMEOUT_S
+                    )
+
+                except (OSError, asyncio.TimeoutError, ConnectionError) as e:
+                    _LOGGER.debug(f"Upstream error (attempt {attempt} of {self.MAX_ATTEMPTS}): {str(e)}")
+                    self._pendingRequests.expire(upstreamId)
+                    self._closeUpstream()
+
+            self.stats["upstream_failures"] += 1
+            return None
+
+    async def _readReply(self, upstreamId: str) -> bytes:
+        while True:
+            frames, self._upstreamBuffer = Message.splitFrames(self._upstreamBuffer)
+            for index, frame in enumerate(frames):
+                messageId = Message.frameMessageId(frame)
+                found, _ = self._pendingRequests.resolve(messageId)
+                if found and messageId == upstreamId:
+                    # Keep whatever came after the reply for the next read
+                    self._upstreamBuffer = (
+                        b"".join(frames[index + 1 :]) + self._upstreamBuffer
+                    )
+                    return frame
+                _LOGGER.debug(f"Dropping reply with unexpected ID: {messageId}")
+
+            data = await self._upstreamReader.read(1024)
+            if not data:
+                raise ConnectionError("Stove closed the connection")
+            self._upstreamBuffer += data
+
+    def _closeUpstream(self):
+        if self._upstreamWriter is not None:
+            self._upstreamWriter.close()
+        self._upstreamReader = None
+        self._upstreamWriter = None
+        self._upstreamBuffer = b""
@@ -0,0 +1,78 @@
+import threading
+import time
+
+
+class TokenBucket:
+    # Limits the requests sent to one stove: `rate` tokens per second with
+    # up to `burst` tokens saved up. Callers past the burst are queued in
+    # arrival order, each one reserving the next token as it comes.
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updatedAt = time.monotonic()
+        self._lock = threading.Lock()
+
+        self.granted = 0
+        self.throttled = 0
+        self.cancelled = 0
+        self.waiting = 0
+        self.totalWaitS = 0.0
+        self.maxWaitS = 0.0
+
+    def reserve(self, tokens: int = 1) -> float:
+        # Takes the tokens and returns how long to wait before using them
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updatedAt) * self.rate
+            )
+            self._updatedAt = now
+            self._tokens -= tokens
+            self.granted += 1
+
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            if wait > 0:
+                self.throttled += 1
+                self.totalWaitS += wait
+                self.maxWaitS = max(self.maxWaitS, wait)
+            return wait
+
+    def release(self, tokens: int = 1):
+        # Gives back reserved tokens that were not used
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + tokens)
+            self.cancelled += 1
+
+    def acquire(self, tokens: int = 1, cancelEvent: threading.Event = None) -> bool:
+        wait = self.reserve(tokens)
+        if wait <= 0:
+            return True
+
+        with self._lock:
+            self.waiting += 1
+        try:
+            if cancelEvent is not None:
+                if cancelEvent.wait(wait):
+                    self.release(tokens)
+                    return False
+            else:
+                time.sleep(wait)
+        finally:
+            with self._lock:
+                self.waiting -= 1
+        return True
+
+    def getStats(self) -> dict:
+        with self._lock:
+            return {
+                "rate_per_s": self.rate,
+                "burst": self.burst,
+                "granted": self.granted,
+                "throttled": self.throttled,
+                "cancelled": self.cancelled,
+                "waiting": self.waiting,
+                "avg_wait_s": round(self.totalWaitS / self.throttled, 3) if self.throttled else 0.0,
+                "max_wait_s": round(self.maxWaitS, 3),
+            }
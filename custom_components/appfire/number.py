@@ -9,7 +9,10 @@ from homeassistant.const import UnitOfTemperature
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, API_DATA_LOOKUP_DESIRED_AMBIENT_TEMPERATURE
+from .const import (
+    DOMAIN,
+    API_DATA_LOOKUP_DESIRED_AMBIENT_TEMPERATURE,
+)
 from .coordinator import AppFireCoordinator
 from .entity import AppFireEntity
 
@@ -36,6 +39,8 @@ class DesiredAmbientTemperature(AppFireEntity, NumberEntity):
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
     _attr_native_step = 0.1
     _attr_translation_key = "desired_ambient_temperature"
+    # Superseded by the climate entity
+    _attr_entity_registry_enabled_default = False
 
     def __init__(self, coordinator: AppFireCoordinator):
         """Initialize the number entity."""
@@ -45,13 +50,13 @@ class DesiredAmbientTemperature(AppFireEntity, NumberEntity):
 
     @property
     def native_min_value(self) -> float:
-        """Return the minimum value."""
-        return 10
+        """Return the minimum value reported by the stove."""
+        return self.coordinator.bounds[self._idx][0]
 
     @property
     def native_max_value(self) -> float:
-        """Return the maximum value."""
-        return 50
+        """Return the maximum value reported by the stove."""
+        return self.coordinator.bounds[self._idx][1]
 
     @callback
     def _handle_coordinator_update(self) -> None:
@@ -61,7 +66,10 @@ class DesiredAmbientTemperature(AppFireEntity, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the desired ambient temperature."""
-        await self.hass.async_add_executor_job(
-            self.coordinator.api.setDesiredAmbientTemperature, value
+        # pylint: disable-next=import-outside-toplevel
+        from .lib.appfire_client.message_data_write_request import MessageDataWriteRequest
+
+        self.coordinator.validate_value(self._idx, value)
+        await self.coordinator.async_write_registers(
+            MessageDataWriteRequest.encodeDesiredAmbientTemperature(value)
         )
-        await self.coordinator.async_request_refresh()
@@ -0,0 +1,191 @@
+"""Sampling profiler for the AppFire integration."""
+from __future__ import annotations
+
+from collections import defaultdict
+import os
+import sys
+import threading
+import time
+from types import CodeType, FrameType
+
+INTEGRATION_DIR = os.path.dirname(os.path.abspath(__file__))
+
+UNATTRIBUTED = "unattributed"
+
+
+class _Stats:
+    """Samples and CPU time of one function or stove."""
+
+    __slots__ = ("self_samples", "total_samples", "self_cpu_s", "total_cpu_s")
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.self_samples = 0
+        self.total_samples = 0
+        self.self_cpu_s = 0.0
+        self.total_cpu_s = 0.0
+
+
+class AppFireProfiler:
+    """Sample the stacks of all threads and keep the integration frames.
+
+    Nothing is hooked into the profiled code, the sampling thread only
+    exists while a profile is being taken. Samples are attributed to a
+    stove through the `self` of the integration frames on the stack.
+    """
+
+    def __init__(self, owners: dict[int, str], interval_s: float) -> None:
+        """Initialize the profiler.
+
+        owners maps the id of the objects of a stove (coordinator, API,
+        scheduler, ...) to the stove name.
+        """
+        self._owners = owners
+        self._interval_s = interval_s
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._function_names: dict[CodeType, str | None] = {}
+        self._cpu_available = hasattr(time, "pthread_getcpuclockid")
+
+        self.samples = 0
+        self.duration_s = 0.0
+        self.functions: dict[str, _Stats] = defaultdict(_Stats)
+        self.stoves: dict[str, _Stats] = defaultdict(_Stats)
+
+    def start(self) -> None:
+        """Start sampling in a background thread."""
+        self._thread = threading.Thread(
+            target=self._run, name="appfire_profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampling thread."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def format_report(self, top: int = 30) -> str:
+        """Return the report as text."""
+        # Wall time is estimated from the share of samples
+        sample_s = self.duration_s / self.samples if self.samples else 0.0
+        cpu_note = "" if self._cpu_available else " (not available on this platform)"
+        lines = [
+            "AppFire profile",
+            f"Duration: {self.duration_s:.1f}s, {self.samples} samples "
+            f"every {self._interval_s * 1000:.0f}ms",
+            f"CPU time is per thread, charged to the stack found at each sample{cpu_note}",
+            "",
+            f"Top {top} functions by own wall time",
+            f"{'own wall s':>10} {'own cpu s':>10} {'total wall s':>12} "
+            f"{'total cpu s':>11}  function",
+        ]
+        functions = sorted(
+            self.functions.items(),
+            key=lambda item: (item[1].self_samples, item[1].total_samples),
+            reverse=True,
+        )
+        for name, stats in functions[:top]:
+            lines.append(
+                f"{stats.self_samples * sample_s:10.3f} {stats.self_cpu_s:10.3f} "
+                f"{stats.total_samples * sample_s:12.3f} {stats.total_cpu_s:11.3f}  {name}"
+            )
+
+        lines += [
+            "",
+            "Per stove",
+            f"{'wall s':>10} {'cpu s':>10}  stove",
+        ]
+        for name, stats in sorted(
+            self.stoves.items(), key=lambda item: item[1].total_samples, reverse=True
+        ):
+            lines.append(
+                f"{stats.total_samples * sample_s:10.3f} {stats.total_cpu_s:10.3f}  {name}"
+            )
+        return "\n".join(lines) + "\n"
+
+    # private methods
+
+    def _run(self) -> None:
+        own_thread = threading.get_ident()
+        last_cpu: dict[int, float] = {}
+        started = time.monotonic()
+        next_sample = started
+
+        while not self._stop_event.is_set():
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_thread:
+                    continue
+                # CPU time used by the thread since the previous sample
+                cpu_s = self._thread_cpu_s(thread_id)
+                previous_cpu_s = last_cpu.get(thread_id)
+                cpu_delta_s = 0.0
+                if cpu_s is not None:
+                    if previous_cpu_s is not None:
+                        cpu_delta_s = cpu_s - previous_cpu_s
+                    last_cpu[thread_id] = cpu_s
+
+                stack = self._integration_stack(frame)
+                if stack:
+                    self._record(stack, cpu_delta_s)
+            self.samples += 1
+
+            next_sample += self._interval_s
+            self._stop_event.wait(max(0.0, next_sample - time.monotonic()))
+
+        self.duration_s = time.monotonic() - started
+
+    def _thread_cpu_s(self, thread_id: int) -> float | None:
+        if not self._cpu_available:
+            return None
+        try:
+            return time.clock_gettime(time.pthread_getcpuclockid(thread_id))
+        except OSError:
+            # The thread ended in the meantime
+            return None
+
+    def _function_name(self, code: CodeType) -> str | None:
+        # Returns None for code outside the integration
+        if code not in self._function_names:
+            name = None
+            if code.co_filename.startswith(INTEGRATION_DIR):
+                path = os.path.relpath(code.co_filename, INTEGRATION_DIR)
+                qualname = getattr(code, "co_qualname", code.co_name)
+                name = f"{path}:{code.co_firstlineno}({qualname})"
+            self._function_names[code] = name
+        return self._function_names[code]
+
+    def _integration_stack(self, frame: FrameType | None) -> list[tuple[FrameType, str]]:
+        # Innermost frame first
+        stack = []
+        while frame is not None:
+            name = self._function_name(frame.f_code)
+            if name is not None:
+                stack.append((frame, name))
+            frame = frame.f_back
+        return stack
+
+    def _stove_of(self, stack: list[tuple[FrameType, str]]) -> str:
+        for frame, _ in stack:
+            instance = frame.f_locals.get("self")
+            owner = self._owners.get(id(instance))
+            if owner is None:
+                # Entities are found through their coordinator
+                owner = self._owners.get(id(getattr(instance, "coordinator", None)))
+            if owner is not None:
+                return owner
+        return UNATTRIBUTED
+
+    def _record(self, stack: list[tuple[FrameType, str]], cpu_delta_s: float) -> None:
+        own = self.functions[stack[0][1]]
+        own.self_samples += 1
+        own.self_cpu_s += cpu_delta_s
+        # Recursive functions are counted once per sample
+        for name in {name for _, name in stack}:
+            stats = self.functions[name]
+            stats.total_samples += 1
+            stats.total_cpu_s += cpu_delta_s
+
+        stove = self.stoves[self._stove_of(stack)]
+        stove.total_samples += 1
+        stove.total_cpu_s += cpu_delta_s
@@ -0,0 +1,57 @@
+"""Repairs for the AppFire integration."""
+from __future__ import annotations
+
+import voluptuous as vol
+
+from homeassistant.components.repairs import RepairsFlow
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers import issue_registry as ir
+
+from .const import DOMAIN, CONF_IP
+
+
+class StoveMovedRepairFlow(RepairsFlow):
+    """Let the user confirm the new address of a stove that stopped answering."""
+
+    def __init__(self, entry_id: str, candidates: list[str]) -> None:
+        """Initialize the flow."""
+        self._entry_id = entry_id
+        self._candidates = candidates
+
+    async def async_step_init(
+        self, user_input: dict[str, str] | None = None
+    ) -> FlowResult:
+        """Handle the first step of the fix flow."""
+        return await self.async_step_confirm()
+
+    async def async_step_confirm(
+        self, user_input: dict[str, str] | None = None
+    ) -> FlowResult:
+        """Ask which of the stoves that answered is this one."""
+        if user_input is not None:
+            coordinator = self.hass.data.get(DOMAIN, {}).get(self._entry_id)
+            if coordinator is None:
+                return self.async_abort(reason="not_loaded")
+            coordinator.async_confirm_stove_ip(user_input[CONF_IP])
+            return self.async_create_entry(data={})
+
+        description_placeholders = None
+        if issue := ir.async_get(self.hass).async_get_issue(self.handler, self.issue_id):
+            description_placeholders = issue.translation_placeholders
+
+        return self.async_show_form(
+            step_id="confirm",
+            data_schema=vol.Schema({vol.Required(CONF_IP): vol.In(self._candidates)}),
+            description_placeholders=description_placeholders,
+        )
+
+
+async def async_create_fix_flow(
+    hass: HomeAssistant,
+    issue_id: str,
+    data: dict[str, str | int | float | None] | None,
+) -> RepairsFlow:
+    """Create a flow to fix an issue."""
+    assert data is not None
+    return StoveMovedRepairFlow(str(data["entry_id"]), str(data["candidates"]).split(","))
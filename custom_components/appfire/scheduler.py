@@ -0,0 +1,160 @@
+"""Prioritised request scheduler for AppFire stoves."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+PRIORITY_COMMAND = 0
+PRIORITY_POLL = 1
+
+
+class PollPreempted(Exception):
+    """Error to indicate a background poll gave way to a command."""
+
+
+class _WaitStats:
+    """Wait time statistics for one priority class."""
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.count = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+        self.last_s = 0.0
+
+    def record(self, wait_s: float) -> None:
+        """Record the time a request waited for the stove."""
+        self.count += 1
+        self.total_s += wait_s
+        self.last_s = wait_s
+        self.max_s = max(self.max_s, wait_s)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dictionary."""
+        return {
+            "count": self.count,
+            "avg_s": round(self.total_s / self.count, 3) if self.count else 0.0,
+            "max_s": round(self.max_s, 3),
+            "last_s": round(self.last_s, 3),
+        }
+
+
+class AppFireRequestScheduler:
+    """Serialize the requests sent to one stove.
+
+    The stove Wi-Fi module handles a single connection at a time, so every
+    request goes through here. Commands are served before background polls
+    and a poll in progress is asked to give up when a command arrives.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._busy = False
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._poll_cancel_event: threading.Event | None = None
+
+        self.max_queue_depth = 0
+        self.preempted_polls = 0
+        self._wait_stats = {
+            PRIORITY_COMMAND: _WaitStats(),
+            PRIORITY_POLL: _WaitStats(),
+        }
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of requests waiting for the stove."""
+        return sum(1 for _, _, waiter in self._waiters if not waiter.done())
+
+    @property
+    def commands_pending(self) -> bool:
+        """Return True if a command is waiting for the stove."""
+        return any(
+            priority == PRIORITY_COMMAND and not waiter.done()
+            for priority, _, waiter in self._waiters
+        )
+
+    async def async_command(self, target: Callable[..., Any], *args: Any) -> Any:
+        """Run a user command in the executor ahead of any queued poll."""
+        await self._async_acquire(PRIORITY_COMMAND)
+        try:
+            return await self.hass.async_add_executor_job(target, *args)
+        finally:
+            self._release()
+
+    async def async_poll(self, target: Callable[[threading.Event], Any]) -> Any:
+        """Run a background read in the executor.
+
+        The target receives a cancel event that is set when a command is
+        queued meanwhile; PollPreempted is raised if the target gave up
+        because of it. A read that completed anyway is returned.
+        """
+        await self._async_acquire(PRIORITY_POLL)
+        cancel_event = threading.Event()
+        self._poll_cancel_event = cancel_event
+        try:
+            result = await self.hass.async_add_executor_job(target, cancel_event)
+        finally:
+            self._poll_cancel_event = None
+            self._release()
+
+        if cancel_event.is_set() and result is None:
+            self.preempted_polls += 1
+            raise PollPreempted
+        return result
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the scheduler metrics for diagnostics."""
+        return {
+            "busy": self._busy,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "preempted_polls": self.preempted_polls,
+            "command_wait": self._wait_stats[PRIORITY_COMMAND].as_dict(),
+            "poll_wait": self._wait_stats[PRIORITY_POLL].as_dict(),
+        }
+
+    # private methods
+
+    async def _async_acquire(self, priority: int) -> None:
+        queued_at = time.monotonic()
+
+        if self._busy or self._waiters:
+            if priority == PRIORITY_COMMAND and self._poll_cancel_event is not None:
+                _LOGGER.debug("Command queued, cancelling the poll in progress")
+                self._poll_cancel_event.set()
+
+            waiter: asyncio.Future[None] = self.hass.loop.create_future()
+            heapq.heappush(self._waiters, (priority, next(self._sequence), waiter))
+            self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # The stove may have been handed over right before cancellation
+                if waiter.done() and not waiter.cancelled():
+                    self._release()
+                raise
+        else:
+            self._busy = True
+
+        self._wait_stats[priority].record(time.monotonic() - queued_at)
+
+    def _release(self) -> None:
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                # Hand the stove over directly, it stays busy
+                waiter.set_result(None)
+                return
+        self._busy = False
@@ -1,210 +1,320 @@
 """Platform for sensor integration."""
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
 import logging
+from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfTemperature
+from homeassistant.const import (
+    REVOLUTIONS_PER_MINUTE,
+    UnitOfEnergy,
+    UnitOfMass,
+    UnitOfTemperature,
+)
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType, StateType
 
-from homeassistant.const import REVOLUTIONS_PER_MINUTE
-
+from .aggregator import AppFireFleetAggregator
 from .const import (
     DOMAIN,
+    DATA_AGGREGATOR,
     API_DATA_LOOKUP_POWER_PERCENTAGE,
     API_DATA_LOOKUP_AMBIENT_TEMPERATURE,
     API_DATA_LOOKUP_STOVE_STATUS,
     API_DATA_LOOKUP_ECO_MODE,
+    API_DATA_LOOKUP_CRONO_MODE,
+    API_DATA_LOOKUP_CRONO_SCHEDULE,
     API_DATA_LOOKUP_SMOKE_TEMPERATURE,
     API_DATA_LOOKUP_SMOKE_FAN_RPM,
     API_DATA_LOOKUP_FAN1_PERCENTAGE,
+    API_DATA_LOOKUP_DESIRED_MAX_POWER_PERCENTAGE,
+    ESTIMATE_PELLET_CONSUMED,
+    ESTIMATE_ENERGY,
 )
+from .coordinator import AppFireCoordinator
+from .crono import next_start, schedule_by_day
 from .entity import AppFireEntity
 from .lib.appfire_client.status.stove_status import StoveStatus as StoveStatusApi
 
 _LOGGER = logging.getLogger(__name__)
 
 
-async def async_setup_entry(
-    hass: HomeAssistant,
-    config_entry: ConfigEntry,
-    async_add_entities: AddEntitiesCallback,
-) -> None:
-    """Set up the sensor entity."""
+@dataclass(frozen=True, kw_only=True)
+class AppFireSensorEntityDescription(SensorEntityDescription):
+    """Describes an AppFire sensor, the key is the coordinator data key."""
 
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    unique_id_suffix: str
+    # Turns the raw value from the stove into the sensor state
+    value_fn: Callable[[Any], StateType] = lambda value: value
+    attributes_fn: Callable[[Any], dict[str, Any]] | None = None
+    # Report the bounds of the setting kept by the coordinator as attributes
+    bounded: bool = False
 
-    async_add_entities(
-        [
-            StoveStatus(coordinator),
-            PowerPercentage(coordinator),
-            AmbientTemperature(coordinator),
-            # Disabled by default
-            EcoMode(coordinator),
-            SmokeTemperature(coordinator),
-            SmokeFanRpm(coordinator),
-            Fan1Percentage(coordinator),
-        ]
-    )
-
-
-class StoveStatus(AppFireEntity, SensorEntity):
-    """Sensor for stove status."""
 
-    _attr_device_class = SensorDeviceClass.ENUM
-    _attr_options = StoveStatusApi.get_all_status_keys()
-    _attr_translation_key = "stove_status"
-
-    def __init__(self, coordinator):
-        """Initialize the sensor."""
-        super().__init__(coordinator, context=API_DATA_LOOKUP_STOVE_STATUS)
-        self._idx = API_DATA_LOOKUP_STOVE_STATUS
-        self._attr_unique_id = f"{self.coordinator.stove_serial}_sensor_status"
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        status_code = self.coordinator.data[self._idx]
+SENSOR_DESCRIPTIONS: tuple[AppFireSensorEntityDescription, ...] = (
+    AppFireSensorEntityDescription(
+        key=API_DATA_LOOKUP_STOVE_STATUS,
+        unique_id_suffix="sensor_status",
+        translation_key="stove_status",
+        device_class=SensorDeviceClass.ENUM,
+        options=StoveStatusApi.get_all_status_keys(),
         # Returns translation key (e.g., "off", "on", "cooling_down").
         # Unknown status codes will return "unknown_X" and cause HA warnings
         # since they won't match the predefined options. This is intentional
         # to preserve the status code for debugging.
-        self._attr_native_value = StoveStatusApi.status_to_key(status_code)
-        self.async_write_ha_state()
-
+        value_fn=StoveStatusApi.status_to_key,
+    ),
+    AppFireSensorEntityDescription(
+        key=API_DATA_LOOKUP_POWER_PERCENTAGE,
+        unique_id_suffix="sensor_power_level",
+        translation_key="power_percentage",
+        icon="mdi:percent",
+        native_unit_of_measurement="%",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+    ),
+    AppFireSensorEntityDescription(
+        key=API_DATA_LOOKUP_AMBIENT_TEMPERATURE,
+        unique_id_suffix="sensor_ambient_temperature",
+        translation_key="ambient_temperature",
+        icon="mdi:home-thermometer",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    # Estimated from the power level over time
+    AppFireSensorEntityDescription(
+        key=ESTIMATE_PELLET_CONSUMED,
+        unique_id_suffix="sensor_pellet_consumed",
+        translation_key="pellet_consumed",
+        icon="mdi:grain",
+        native_unit_of_measurement=UnitOfMass.KILOGRAMS,
+        device_class=SensorDeviceClass.WEIGHT,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        suggested_display_precision=2,
+    ),
+    AppFireSensorEntityDescription(
+        key=ESTIMATE_ENERGY,
+        unique_id_suffix="sensor_energy",
+        translation_key="energy",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        suggested_display_precision=2,
+    ),
+    AppFireSensorEntityDescription(
+        key=API_DATA_LOOKUP_CRONO_MODE,
+        unique_id_suffix="sensor_crono_mode",
+        translation_key="crono_mode",
+        icon="mdi:calendar-clock",
+        value_fn=lambda value: "On" if value else "Off",
+    ),
+    # Disabled by default
+    AppFireSensorEntityDescription(
+        key=API_DATA_LOOKUP_ECO_MODE,
+        unique_id_suffix="sensor_eco_mode",
+        translation_key="eco_mode",
+        icon="mdi:leaf",
+        entity_registry_enabled_default=False,
+        value_fn=lambda value: "On" if value else "Off",
+    ),
+    # Read on a long interval, the schedule layout is not confirmed on
+    # every stove model
+    AppFireSensorEntityDescription(
+        key=API_DATA_LOOKUP_CRONO_SCHEDULE,
+        unique_id_suffix="sensor_next_crono_start",
+        translation_key="next_crono_start",
+        icon="mdi:calendar-clock",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        entity_registry_enabled_default=False,
+        value_fn=next_start,
+        attributes_fn=lambda schedule: (
+            schedule_by_day(schedule) if schedule is not None else {}
+        ),
+    ),
+    # Read-only until the register to write it is confirmed
+    AppFireSensorEntityDescription(
+        key=API_DATA_LOOKUP_DESIRED_MAX_POWER_PERCENTAGE,
+        unique_id_suffix="sensor_desired_max_power_percentage",
+        translation_key="desired_max_power_percentage",
+        icon="mdi:fire-circle",
+        native_unit_of_measurement="%",
+        suggested_display_precision=0,
+        bounded=True,
+    ),
+    AppFireSensorEntityDescription(
+        key=API_DATA_LOOKUP_SMOKE_TEMPERATURE,
+        unique_id_suffix="sensor_smoke_temperature",
+        translation_key="smoke_temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+    ),
+    AppFireSensorEntityDescription(
+        key=API_DATA_LOOKUP_SMOKE_FAN_RPM,
+        unique_id_suffix="sensor_smoke_fan_rpm",
+        translation_key="smoke_fan_rpm",
+        icon="mdi:fan",
+        native_unit_of_measurement=REVOLUTIONS_PER_MINUTE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+    ),
+    AppFireSensorEntityDescription(
+        key=API_DATA_LOOKUP_FAN1_PERCENTAGE,
+        unique_id_suffix="sensor_fan1_percentage",
+        translation_key="fan1_percentage",
+        icon="mdi:fan",
+        native_unit_of_measurement="%",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        entity_registry_enabled_default=False,
+    ),
+)
 
-class PowerPercentage(AppFireEntity, SensorEntity):
-    """Sensor for power percentage."""
 
-    _attr_icon = "mdi:percent"
-    _attr_native_unit_of_measurement = "%"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_suggested_display_precision = 0
-    _attr_translation_key = "power_percentage"
+@dataclass(frozen=True, kw_only=True)
+class AppFireFleetSensorEntityDescription(SensorEntityDescription):
+    """Describes a site-wide sensor over all the stoves."""
+
+    value_fn: Callable[[AppFireFleetAggregator], StateType]
+
+
+FLEET_SENSOR_DESCRIPTIONS: tuple[AppFireFleetSensorEntityDescription, ...] = (
+    AppFireFleetSensorEntityDescription(
+        key="stoves_burning",
+        translation_key="fleet_stoves_burning",
+        icon="mdi:fire",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda aggregator: aggregator.stoves_burning,
+    ),
+    AppFireFleetSensorEntityDescription(
+        key="stoves_in_error",
+        translation_key="fleet_stoves_in_error",
+        icon="mdi:alert",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda aggregator: aggregator.stoves_in_error,
+    ),
+    AppFireFleetSensorEntityDescription(
+        key="total_power_percentage",
+        translation_key="fleet_total_power_percentage",
+        icon="mdi:percent",
+        native_unit_of_measurement="%",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda aggregator: aggregator.total_power_percentage,
+    ),
+    AppFireFleetSensorEntityDescription(
+        key="mean_ambient_temperature",
+        translation_key="fleet_mean_ambient_temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda aggregator: aggregator.mean_ambient_temperature,
+    ),
+)
 
-    def __init__(self, coordinator):
-        """Initialize the sensor."""
-        super().__init__(coordinator, context=API_DATA_LOOKUP_POWER_PERCENTAGE)
-        self._idx = API_DATA_LOOKUP_POWER_PERCENTAGE
-        self._attr_unique_id = f"{self.coordinator.stove_serial}_sensor_power_level"
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._attr_native_value = self.coordinator.data[self._idx]
-        self.async_write_ha_state()
+async def async_setup_platform(
+    hass: HomeAssistant,
+    config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Set up the site-wide sensors, loaded by the integration setup."""
+    if discovery_info is None:
+        return
 
+    aggregator = hass.data[DATA_AGGREGATOR]
+    async_add_entities(
+        AppFireFleetSensor(aggregator, description)
+        for description in FLEET_SENSOR_DESCRIPTIONS
+    )
 
-class AmbientTemperature(AppFireEntity, SensorEntity):
-    """Sensor for ambient temperature."""
 
-    _attr_icon = "mdi:home-thermometer"
-    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-    _attr_device_class = SensorDeviceClass.TEMPERATURE
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_translation_key = "ambient_temperature"
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the sensor entity."""
 
-    def __init__(self, coordinator):
-        """Initialize the sensor."""
-        super().__init__(coordinator, context=API_DATA_LOOKUP_AMBIENT_TEMPERATURE)
-        self._idx = API_DATA_LOOKUP_AMBIENT_TEMPERATURE
-        self._attr_unique_id = f"{self.coordinator.stove_serial}_sensor_ambient_temperature"
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._attr_native_value = self.coordinator.data[self._idx]
-        self.async_write_ha_state()
+    async_add_entities(
+        AppFireSensor(coordinator, description) for description in SENSOR_DESCRIPTIONS
+    )
 
 
-class EcoMode(AppFireEntity, SensorEntity):
-    """Sensor for eco mode status."""
+class AppFireSensor(AppFireEntity, SensorEntity):
+    """Sensor for one value read from the stove."""
 
-    _attr_icon = "mdi:leaf"
-    _attr_translation_key = "eco_mode"
-    _attr_entity_registry_enabled_default = False
+    entity_description: AppFireSensorEntityDescription
 
-    def __init__(self, coordinator):
+    def __init__(
+        self,
+        coordinator: AppFireCoordinator,
+        description: AppFireSensorEntityDescription,
+    ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, context=API_DATA_LOOKUP_ECO_MODE)
-        self._idx = API_DATA_LOOKUP_ECO_MODE
-        self._attr_unique_id = f"{self.coordinator.stove_serial}_sensor_eco_mode"
+        super().__init__(coordinator, context=description.key)
+        self.entity_description = description
+        self._attr_unique_id = (
+            f"{self.coordinator.stove_serial}_{description.unique_id_suffix}"
+        )
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self._attr_native_value = "On" if self.coordinator.data[self._idx] else "Off"
+        description = self.entity_description
+        value = self.coordinator.data.get(description.key)
+        self._attr_native_value = description.value_fn(value)
+        if description.attributes_fn is not None:
+            self._attr_extra_state_attributes = description.attributes_fn(value)
+        if description.bounded:
+            min_value, max_value = self.coordinator.bounds[description.key]
+            self._attr_extra_state_attributes = {"min": min_value, "max": max_value}
         self.async_write_ha_state()
 
 
-class SmokeTemperature(AppFireEntity, SensorEntity):
-    """Sensor for smoke/exhaust temperature."""
-
-    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-    _attr_device_class = SensorDeviceClass.TEMPERATURE
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_translation_key = "smoke_temperature"
-    _attr_entity_registry_enabled_default = False
-
-    def __init__(self, coordinator):
-        """Initialize the sensor."""
-        super().__init__(coordinator, context=API_DATA_LOOKUP_SMOKE_TEMPERATURE)
-        self._idx = API_DATA_LOOKUP_SMOKE_TEMPERATURE
-        self._attr_unique_id = f"{self.coordinator.stove_serial}_sensor_smoke_temperature"
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._attr_native_value = self.coordinator.data[self._idx]
-        self.async_write_ha_state()
-
+class AppFireFleetSensor(SensorEntity):
+    """Sensor for an aggregate over all the stoves."""
 
-class SmokeFanRpm(AppFireEntity, SensorEntity):
-    """Sensor for smoke fan RPM."""
+    _attr_has_entity_name = True
+    _attr_should_poll = False
 
-    _attr_icon = "mdi:fan"
-    _attr_native_unit_of_measurement = REVOLUTIONS_PER_MINUTE
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_translation_key = "smoke_fan_rpm"
-    _attr_entity_registry_enabled_default = False
+    entity_description: AppFireFleetSensorEntityDescription
 
-    def __init__(self, coordinator):
+    def __init__(
+        self,
+        aggregator: AppFireFleetAggregator,
+        description: AppFireFleetSensorEntityDescription,
+    ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, context=API_DATA_LOOKUP_SMOKE_FAN_RPM)
-        self._idx = API_DATA_LOOKUP_SMOKE_FAN_RPM
-        self._attr_unique_id = f"{self.coordinator.stove_serial}_sensor_smoke_fan_rpm"
+        self._aggregator = aggregator
+        self.entity_description = description
+        self._attr_unique_id = f"{DOMAIN}_fleet_{description.key}"
+        self._attr_native_value = description.value_fn(aggregator)
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._attr_native_value = self.coordinator.data[self._idx]
-        self.async_write_ha_state()
-
-
-class Fan1Percentage(AppFireEntity, SensorEntity):
-    """Sensor for fan 1 percentage."""
-
-    _attr_icon = "mdi:fan"
-    _attr_native_unit_of_measurement = "%"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_suggested_display_precision = 0
-    _attr_translation_key = "fan1_percentage"
-    _attr_entity_registry_enabled_default = False
-
-    def __init__(self, coordinator):
-        """Initialize the sensor."""
-        super().__init__(coordinator, context=API_DATA_LOOKUP_FAN1_PERCENTAGE)
-        self._idx = API_DATA_LOOKUP_FAN1_PERCENTAGE
-        self._attr_unique_id = f"{self.coordinator.stove_serial}_sensor_fan1_percentage"
+    async def async_added_to_hass(self) -> None:
+        """Follow the aggregates."""
+        self.async_on_remove(
+            self._aggregator.async_add_listener(self._handle_aggregator_update)
+        )
 
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._attr_native_value = self.coordinator.data[self._idx]
-        self.async_write_ha_state()
+    def _handle_aggregator_update(self) -> None:
+        """Write the state if the aggregate changed."""
+        value = self.entity_description.value_fn(self._aggregator)
+        if value != self._attr_native_value:
+            self._attr_native_value = value
+            self.async_write_ha_state()
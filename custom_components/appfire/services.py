@@ -0,0 +1,233 @@
+"""Services for the AppFire integration."""
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    API_DATA_PAGE_PRIMARY,
+    DATA_CONNECTION_LIMITER,
+    MAX_PARALLEL_CONNECTIONS,
+    DATA_PROFILER,
+    PROFILE_DEFAULT_DURATION_S,
+    PROFILE_MAX_DURATION_S,
+    PROFILE_SAMPLE_INTERVAL_S,
+)
+from .coordinator import AppFireCoordinator
+from .profiler import AppFireProfiler
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_PROFILE = "profile"
+SERVICE_READ_REGISTERS = "read_registers"
+SERVICE_WRITE_REGISTERS = "write_registers"
+
+ATTR_DURATION = "duration"
+ATTR_DEVICE_ID = "device_id"
+ATTR_PAGE = "page"
+ATTR_INDICES = "indices"
+ATTR_REGISTERS = "registers"
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=PROFILE_DEFAULT_DURATION_S): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=PROFILE_MAX_DURATION_S)
+        ),
+    }
+)
+
+# Without devices, reads apply to every loaded stove
+READ_REGISTERS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_PAGE, default=API_DATA_PAGE_PRIMARY): vol.All(
+            vol.Coerce(int), vol.Range(min=0)
+        ),
+        vol.Optional(ATTR_INDICES): vol.All(
+            cv.ensure_list, [vol.All(vol.Coerce(int), vol.Range(min=0))]
+        ),
+    }
+)
+
+# Raw values are not checked, writes must name their stoves
+WRITE_REGISTERS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): vol.All(
+            cv.ensure_list, [cv.string], vol.Length(min=1)
+        ),
+        vol.Required(ATTR_REGISTERS): vol.All(
+            {vol.All(vol.Coerce(int), vol.Range(min=0)): vol.Coerce(int)},
+            vol.Length(min=1),
+        ),
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the AppFire services."""
+
+    async def async_profile(call: ServiceCall) -> None:
+        """Profile the integration code and write a report to the config directory."""
+        if hass.data.get(DATA_PROFILER) is not None:
+            raise HomeAssistantError("A profile is already being taken")
+
+        # Objects of each stove, to attribute the samples
+        owners: dict[int, str] = {}
+        for coordinator in hass.data.get(DOMAIN, {}).values():
+            name = coordinator.get_stove_name_or_serial()
+            for owned in (
+                coordinator,
+                coordinator.api,
+                coordinator.scheduler,
+                coordinator.proxy,
+                coordinator.rate_limiter,
+            ):
+                if owned is not None:
+                    owners[id(owned)] = name
+
+        profiler = AppFireProfiler(owners, PROFILE_SAMPLE_INTERVAL_S)
+        hass.data[DATA_PROFILER] = profiler
+        duration = call.data[ATTR_DURATION]
+        _LOGGER.info("Profiling AppFire for %s seconds", duration)
+        try:
+            profiler.start()
+            await asyncio.sleep(duration)
+        finally:
+            await hass.async_add_executor_job(profiler.stop)
+            hass.data.pop(DATA_PROFILER)
+
+        path = hass.config.path(
+            f"{DOMAIN}_profile_{dt_util.now().strftime('%Y%m%d_%H%M%S')}.txt"
+        )
+        report = profiler.format_report()
+        await hass.async_add_executor_job(_write_report, path, report)
+        _LOGGER.info("AppFire profile of %s samples written to %s", profiler.samples, path)
+
+    # Writes to the config directory and samples every thread
+    async_register_admin_service(
+        hass, DOMAIN, SERVICE_PROFILE, async_profile, schema=PROFILE_SCHEMA
+    )
+
+    async def async_read_registers(call: ServiceCall) -> ServiceResponse:
+        """Read raw registers of a page from many stoves at once."""
+        page = call.data[ATTR_PAGE]
+        indices = call.data.get(ATTR_INDICES)
+
+        async def async_read(coordinator: AppFireCoordinator) -> dict:
+            response = await coordinator.scheduler.async_command(
+                coordinator.api.readPage, page
+            )
+            if response is None:
+                raise HomeAssistantError("No valid response from stove")
+            payload = response.getPayload()
+            read = range(len(payload)) if indices is None else indices
+            return {
+                "values": {str(index): response.getRawValue(index) for index in read}
+            }
+
+        return await _async_run_on_stoves(hass, call, async_read)
+
+    async def async_write_registers(call: ServiceCall) -> None:
+        """Write raw registers to many stoves at once."""
+        registers = list(call.data[ATTR_REGISTERS].items())
+
+        async def async_write(coordinator: AppFireCoordinator) -> dict:
+            # Sent in one exchange per stove, followed by one refresh
+            await coordinator.async_write_registers(*registers)
+            return {}
+
+        # Admin services have no response, failures are raised instead
+        response = await _async_run_on_stoves(hass, call, async_write)
+        failed = {
+            serial: result["error"]
+            for serial, result in response["stoves"].items()
+            if "error" in result
+        }
+        if failed:
+            raise HomeAssistantError(f"Failed to write registers: {failed}")
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_READ_REGISTERS,
+        async_read_registers,
+        schema=READ_REGISTERS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    # Raw values can put a stove in any state
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_WRITE_REGISTERS,
+        async_write_registers,
+        schema=WRITE_REGISTERS_SCHEMA,
+    )
+
+
+def _get_coordinators(hass: HomeAssistant, call: ServiceCall) -> list[AppFireCoordinator]:
+    """Return the coordinators of the stoves targeted by a service call."""
+    coordinators = hass.data.get(DOMAIN, {})
+    if ATTR_DEVICE_ID not in call.data:
+        return list(coordinators.values())
+
+    device_registry = dr.async_get(hass)
+    targeted = []
+    for device_id in call.data[ATTR_DEVICE_ID]:
+        device = device_registry.async_get(device_id)
+        entry_ids = device.config_entries if device is not None else set()
+        matching = [
+            coordinators[entry_id] for entry_id in entry_ids if entry_id in coordinators
+        ]
+        if not matching:
+            raise HomeAssistantError(f"Device {device_id} is not a loaded AppFire stove")
+        targeted.extend(matching)
+    return targeted
+
+
+async def _async_run_on_stoves(hass: HomeAssistant, call: ServiceCall, action) -> ServiceResponse:
+    """Run an action on the targeted stoves concurrently.
+
+    The shared connection limiter bounds how many stoves are contacted at
+    the same time. A failing stove is reported in the response and does
+    not stop the others.
+    """
+    limiter = hass.data.setdefault(
+        DATA_CONNECTION_LIMITER, asyncio.Semaphore(MAX_PARALLEL_CONNECTIONS)
+    )
+
+    async def async_run(coordinator: AppFireCoordinator) -> dict:
+        try:
+            async with limiter:
+                return await action(coordinator)
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug("%s failed on %s: %s", call.service, coordinator.stove_serial, err)
+            return {"error": str(err)}
+
+    coordinators = _get_coordinators(hass, call)
+    results = await asyncio.gather(*(async_run(coordinator) for coordinator in coordinators))
+    return {
+        "stoves": {
+            coordinator.stove_serial: result
+            for coordinator, result in zip(coordinators, results)
+        }
+    }
+
+
+def _write_report(path: str, report: str) -> None:
+    with open(path, "w", encoding="utf-8") as report_file:
+        report_file.write(report)
@@ -33,6 +33,8 @@ class PowerStatus(AppFireEntity, SwitchEntity):
     _attr_assumed_state = True
     _attr_device_class = SwitchDeviceClass.SWITCH
     _attr_translation_key = "power_status"
+    # Superseded by the climate entity
+    _attr_entity_registry_enabled_default = False
 
     def __init__(self, coordinator):
         """Initialize the switch."""
@@ -53,10 +55,18 @@ class PowerStatus(AppFireEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs) -> None:
         """Turn the entity on."""
-        await self.hass.async_add_executor_job(self.coordinator.api.turnOn)
-        await self.coordinator.async_request_refresh()
+        # pylint: disable-next=import-outside-toplevel
+        from .lib.appfire_client.message_data_write_request import MessageDataWriteRequest
+
+        await self.coordinator.async_write_registers(
+            MessageDataWriteRequest.encodePowerStatus(True)
+        )
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn the entity off."""
-        await self.hass.async_add_executor_job(self.coordinator.api.turnOff)
-        await self.coordinator.async_request_refresh()
+        # pylint: disable-next=import-outside-toplevel
+        from .lib.appfire_client.message_data_write_request import MessageDataWriteRequest
+
+        await self.coordinator.async_write_registers(
+            MessageDataWriteRequest.encodePowerStatus(False)
+        )
@@ -0,0 +1,63 @@
+"""Websocket API for the AppFire integration."""
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+
+@callback
+def async_setup(hass: HomeAssistant) -> None:
+    """Register the websocket commands."""
+    websocket_api.async_register_command(hass, ws_subscribe_telemetry)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/telemetry/subscribe",
+        vol.Required("entry_id"): str,
+        vol.Optional("keys"): [str],
+    }
+)
+@callback
+def ws_subscribe_telemetry(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Subscribe to the high-rate telemetry of one stove.
+
+    The stove is polled fast only while at least one client is subscribed.
+    Samples are sent straight to the client and do not go through the
+    state machine. The result holds the sample interval, which depends on
+    the rate limit of the stove.
+    """
+    coordinator = hass.data.get(DOMAIN, {}).get(msg["entry_id"])
+    if coordinator is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Stove not found or not loaded"
+        )
+        return
+
+    keys = msg.get("keys")
+
+    @callback
+    def forward_sample(sample: dict[str, Any]) -> None:
+        if keys is not None:
+            sample = {key: sample.get(key) for key in keys}
+        connection.send_message(
+            websocket_api.event_message(
+                msg["id"], {"ts": time.time(), "values": sample}
+            )
+        )
+
+    connection.subscriptions[msg["id"]] = coordinator.async_subscribe_telemetry(
+        forward_sample
+    )
+    connection.send_result(msg["id"], {"interval_s": coordinator.telemetry_interval_s})
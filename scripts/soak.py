@@ -0,0 +1,327 @@
+"""Soak test of the AppFire integration against a local fake stove.
+
+Runs many poll cycles back to back, standing for a long period of polling
+at the usual interval, while the fake stove injects faults. Memory growth
+(tracemalloc), open file descriptors and latency percentiles are compared
+between the start and the end of the run, and the exit code is 1 if one
+of them exceeds its budget. Latency percentiles only take the cycles
+without an injected fault, whose delays and retries would swamp them.
+
+    scripts/soak [--mode coordinator|client] [--cycles N] [--fault-rate P]
+
+The coordinator mode drives AppFireCoordinator and needs Home Assistant
+installed, the client mode only drives the AppFire client.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import logging
+import os
+import random
+import socket
+import sys
+import threading
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+INTEGRATION_DIR = os.path.join(ROOT, "custom_components", "appfire")
+sys.path.insert(0, os.path.join(ROOT, "custom_components"))
+sys.path.insert(0, os.path.join(INTEGRATION_DIR, "lib"))
+
+from appfire_client.appfire import AppFire  # noqa: E402
+from appfire_client.message import Message  # noqa: E402
+from appfire_client.message_data_write_request import (  # noqa: E402
+    MessageDataWriteRequest,
+)
+
+FAULTS = ("drop", "garbage", "bad_crc", "stale_id", "slow", "split")
+
+# Replies of the fake stove, laid out like a real one
+PAGE_0 = ["0"] * 30
+PAGE_0[5] = "8"  # status: on
+PAGE_0[6] = "1"  # power on
+PAGE_0[9] = "215"  # ambient temperature
+PAGE_0[10] = "220"  # desired ambient temperature
+PAGE_0[11] = "70"
+PAGE_0[12] = "300"
+PAGE_0[21] = "1200"  # smoke temperature
+PAGE_0[22] = "60"  # power level
+PAGE_0[23] = "80"
+PAGE_0[24] = "20"
+PAGE_0[25] = "100"
+PAGE_0[26] = "1400"  # smoke fan rpm
+PAGE_2 = ["0"] * 10
+PAGE_2[3] = "40"
+
+
+class FakeStove:
+    """Threaded TCP server answering like a stove, with injected faults."""
+
+    def __init__(self, faultRate: float, seed: int) -> None:
+        self.faultRate = faultRate
+        self.random = random.Random(seed)
+        self.faults = dict.fromkeys(FAULTS, 0)
+        self.requests = 0
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind(("127.0.0.1", 0))
+        self._server.listen(16)
+        self.port = self._server.getsockname()[1]
+
+    def start(self) -> None:
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def stop(self) -> None:
+        self._server.close()
+
+    def faultCount(self) -> int:
+        return sum(self.faults.values())
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                connection, _ = self._server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._handle, args=(connection,), daemon=True).start()
+
+    def _handle(self, connection: socket.socket) -> None:
+        buffer = b""
+        with connection:
+            while True:
+                try:
+                    data = connection.recv(1024)
+                except OSError:
+                    return
+                if not data:
+                    return
+                frames, buffer = Message.splitFrames(buffer + data)
+                for frame in frames:
+                    if not self._reply(connection, frame):
+                        return
+
+    def _reply(self, connection: socket.socket, frame: bytes) -> bool:
+        # Returns False when the connection has been dropped
+        self.requests += 1
+        request = Message(frame)
+        payload = request.getPayload()[:-1]
+        if request.getOperationType() == "R":
+            values = {"0": PAGE_0, "2": PAGE_2}.get(payload[0], [])
+            reply = Message.buildRawData("DAT", "R", values)
+        else:
+            reply = Message.buildRawData("DAT", "W", ["OK"] * (len(payload) // 2))
+        reply = Message.replaceMessageId(reply, request.getMessageId())
+
+        fault = None
+        if self.random.random() < self.faultRate:
+            fault = self.random.choice(FAULTS)
+            self.faults[fault] += 1
+
+        if fault == "drop":
+            return False
+        if fault == "garbage":
+            connection.sendall(b"#zz\x00garbage\n")
+        elif fault == "bad_crc":
+            reply = reply[:-4] + b"0000"
+        elif fault == "stale_id":
+            connection.sendall(Message.replaceMessageId(reply, "000000") + b"\n")
+        elif fault == "slow":
+            time.sleep(0.5)
+        elif fault == "split":
+            connection.sendall(reply[:10])
+            time.sleep(0.05)
+            reply = reply[10:]
+        connection.sendall(reply + b"\n")
+        return True
+
+
+def openDescriptors() -> int | None:
+    try:
+        return len(os.listdir("/proc/self/fd"))
+    except OSError:
+        return None
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class Probe:
+    """Memory, descriptors and latency at the start and the end of the run."""
+
+    def __init__(self) -> None:
+        # Of the fault-free cycles only
+        self.latencies: list[float] = []
+        self.faultyCycles = 0
+        self.startSnapshot = None
+        self.startDescriptors = None
+
+    def markStart(self) -> None:
+        gc.collect()
+        self.startSnapshot = tracemalloc.take_snapshot()
+        self.startDescriptors = openDescriptors()
+
+    def record(self, latency: float, faulty: bool) -> None:
+        if faulty:
+            self.faultyCycles += 1
+        else:
+            self.latencies.append(latency)
+
+    def report(self, args) -> bool:
+        gc.collect()
+        endSnapshot = tracemalloc.take_snapshot()
+        endDescriptors = openDescriptors()
+        ok = True
+
+        filters = [tracemalloc.Filter(True, f"{INTEGRATION_DIR}*")]
+        stats = endSnapshot.filter_traces(filters).compare_to(
+            self.startSnapshot.filter_traces(filters), "lineno"
+        )
+        growthKb = sum(stat.size_diff for stat in stats) / 1024
+        totalGrowthKb = (
+            sum(stat.size for stat in endSnapshot.statistics("filename"))
+            - sum(stat.size for stat in self.startSnapshot.statistics("filename"))
+        ) / 1024
+
+        window = max(1, len(self.latencies) // 5)
+        first, last = self.latencies[:window], self.latencies[-window:]
+        firstP99, lastP99 = percentile(first, 0.99), percentile(last, 0.99)
+        drift = lastP99 / firstP99 if firstP99 > 0 else 1.0
+
+        print(f"cycles: {len(self.latencies)} fault-free, {self.faultyCycles} with faults left out")
+        print(
+            f"latency first/last {window} cycles: "
+            f"p50 {percentile(first, 0.5) * 1000:.1f}/{percentile(last, 0.5) * 1000:.1f}ms, "
+            f"p99 {firstP99 * 1000:.1f}/{lastP99 * 1000:.1f}ms, drift x{drift:.2f}"
+        )
+        print(f"memory growth: integration {growthKb:.1f}KiB, process {totalGrowthKb:.1f}KiB")
+        for stat in stats[:5]:
+            if stat.size_diff:
+                print(f"    {stat.size_diff / 1024:+.1f}KiB {stat.traceback}")
+        if endDescriptors is not None:
+            print(f"open descriptors: {self.startDescriptors} -> {endDescriptors}")
+
+        if growthKb > args.max_memory_growth_kb:
+            print(f"FAIL: memory grew {growthKb:.1f}KiB, budget {args.max_memory_growth_kb}KiB")
+            ok = False
+        if (
+            endDescriptors is not None
+            and endDescriptors - self.startDescriptors > args.max_descriptor_growth
+        ):
+            print(f"FAIL: {endDescriptors - self.startDescriptors} descriptors leaked")
+            ok = False
+        # A few milliseconds either way is scheduling noise, not drift
+        if drift > args.max_p99_drift and lastP99 - firstP99 > args.p99_noise_ms / 1000:
+            print(f"FAIL: p99 latency drifted x{drift:.2f}, budget x{args.max_p99_drift}")
+            ok = False
+        return ok
+
+
+def runClient(args, stove: FakeStove, probe: Probe) -> None:
+    api = AppFire("127.0.0.1", stove.port)
+    for cycle in range(args.cycles):
+        if cycle == args.warmup:
+            probe.markStart()
+        started = time.monotonic()
+        faults = stove.faultCount()
+        api.readPage(0)
+        if cycle % args.write_every == 0:
+            api.writeRegisters([MessageDataWriteRequest.encodeDesiredAmbientTemperature(22)])
+        if cycle >= args.warmup:
+            probe.record(time.monotonic() - started, stove.faultCount() != faults)
+
+
+async def runCoordinator(args, stove: FakeStove, probe: Probe) -> None:
+    import tempfile
+
+    from homeassistant.core import HomeAssistant
+
+    from appfire.const import API_DATA_LOOKUP_FAN1_PERCENTAGE, CONF_IP, CONF_PORT
+    from appfire.coordinator import AppFireCoordinator
+
+    with tempfile.TemporaryDirectory() as configDir:
+        hass = HomeAssistant(configDir)
+        api = AppFire("127.0.0.1", stove.port)
+        coordinator = AppFireCoordinator(hass, "Soak", "SOAK0001", api, 60)
+        # Stands for the config entry, only its data is read
+        coordinator.config_entry = SimpleNamespace(
+            data={CONF_IP: "127.0.0.1", CONF_PORT: stove.port}
+        )
+        # Entities listening to both pages
+        removeListeners = [
+            coordinator.async_add_listener(lambda: None),
+            coordinator.async_add_listener(
+                lambda: None, context=API_DATA_LOOKUP_FAN1_PERCENTAGE
+            ),
+        ]
+
+        for cycle in range(args.cycles):
+            if cycle == args.warmup:
+                probe.markStart()
+            started = time.monotonic()
+            faults = stove.faultCount()
+            await coordinator.async_refresh()
+            if cycle % args.write_every == 0:
+                await coordinator.async_write_registers(
+                    MessageDataWriteRequest.encodeDesiredAmbientTemperature(22)
+                )
+            if cycle >= args.warmup:
+                probe.record(time.monotonic() - started, stove.faultCount() != faults)
+
+        for removeListener in removeListeners:
+            removeListener()
+        await coordinator.async_shutdown()
+        await hass.async_stop(force=True)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Soak test against a fake stove.")
+    parser.add_argument("--mode", choices=("coordinator", "client"), default="coordinator")
+    parser.add_argument("--cycles", type=int, default=5000)
+    parser.add_argument("--warmup", type=int, default=200)
+    parser.add_argument("--write-every", type=int, default=50)
+    parser.add_argument("--fault-rate", type=float, default=0.02)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--poll-interval", type=float, default=60, help="stood for, in seconds")
+    parser.add_argument("--max-memory-growth-kb", type=float, default=256)
+    parser.add_argument("--max-descriptor-growth", type=int, default=4)
+    parser.add_argument("--max-p99-drift", type=float, default=2.0)
+    parser.add_argument("--p99-noise-ms", type=float, default=5.0)
+    args = parser.parse_args(argv)
+    if args.cycles <= args.warmup:
+        parser.error("--cycles must be greater than --warmup")
+
+    # The client logs the injected faults as errors
+    logging.basicConfig(level=logging.CRITICAL)
+
+    stove = FakeStove(args.fault_rate, args.seed)
+    stove.start()
+    probe = Probe()
+    tracemalloc.start()
+    started = time.monotonic()
+    try:
+        if args.mode == "client":
+            runClient(args, stove, probe)
+        else:
+            asyncio.run(runCoordinator(args, stove, probe))
+    finally:
+        stove.stop()
+
+    days = args.cycles * args.poll_interval / 86400
+    print(
+        f"{args.mode} mode, {time.monotonic() - started:.0f}s standing for "
+        f"{days:.1f} days of polling every {args.poll_interval:.0f}s"
+    )
+    print(f"stove requests: {stove.requests}, faults injected: {stove.faults}")
+    ok = probe.report(args)
+    print("PASS" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())